@@ -168,6 +168,9 @@ import json
 #     REPORT_SYNTHESIZER_PROMPT,
 # )
 
+# Parsed once at import instead of on every ReportSynthesizer.run
+_REPORT_SYNTHESIZER_TMPL = ChatPromptTemplate.from_template(REPORT_SYNTHESIZER_PROMPT)
+
 
 class BaseWorker:
     def __init__(self, tools: list, name: str, system_prompt_extension: str):
@@ -282,7 +285,7 @@ class ReportSynthesizer:
         self.logger = logging.getLogger(__name__)
 
     def run(self, state: Dict[str, Any], config: Optional[RunnableConfig] = None) -> Dict[str, Any]:
-        prompt = ChatPromptTemplate.from_template(REPORT_SYNTHESIZER_PROMPT)
+        prompt = _REPORT_SYNTHESIZER_TMPL
         chain = prompt | self.llm
         try:
             # Ensure aggregated_results is a string for the prompt
@@ -917,6 +920,14 @@ from multi_agents.database.airbnb_db import AirbnbDB
 # )
 # from ..graph.state import AgentState
 
+# Supervisor prompt templates, parsed once at import instead of per planning call
+_INITIAL_PLAN_TMPL = ChatPromptTemplate.from_template(SUPERVISOR_INITIAL_PLAN_PROMPT)
+_REASSESS_PLAN_TMPL = ChatPromptTemplate.from_template(SUPERVISOR_REASSESS_PLAN_PROMPT)
+_INITIAL_PLAN_MULTI_TMPL = ChatPromptTemplate.from_template(SUPERVISOR_INITIAL_PLAN_PROMPT_MULTI)
+_REASSESS_PLAN_MULTI_TMPL = ChatPromptTemplate.from_template(SUPERVISOR_REASSESS_PLAN_PROMPT_MULTI)
+_INITIAL_PLAN_ENHANCED_TMPL = ChatPromptTemplate.from_template(SUPERVISOR_INITIAL_PLAN_PROMPT_ENHANCED)
+_REASSESS_PLAN_ENHANCED_TMPL = ChatPromptTemplate.from_template(SUPERVISOR_REASSESS_PLAN_PROMPT_ENHANCED)
+
 class Supervisor:
     def __init__(self):
         self.llm = ChatOpenAI(
@@ -1038,7 +1049,7 @@ class Supervisor:
     # --- Planning Logic ---
     def create_initial_plan(self, host_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate initial investigation plan based on DB data."""
-        prompt = ChatPromptTemplate.from_template(SUPERVISOR_INITIAL_PLAN_PROMPT)
+        prompt = _INITIAL_PLAN_TMPL
         chain = prompt | self.llm | self.parser
         try:
             # Serialize data for the prompt
@@ -1053,7 +1064,7 @@ class Supervisor:
 
     def reassess_plan(self, state: AgentState) -> List[Dict[str, Any]]:
         """Re-evaluates and updates the investigation plan."""
-        prompt = ChatPromptTemplate.from_template(SUPERVISOR_REASSESS_PLAN_PROMPT)
+        prompt = _REASSESS_PLAN_TMPL
         chain = prompt | self.llm | self.parser
         try:
             # Serialize complex objects for the prompt
@@ -1141,7 +1152,7 @@ class SupervisorMulti(Supervisor):
 
     def create_initial_plan(self, host_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate initial investigation plan with multiple tasks based on DB data."""
-        prompt = ChatPromptTemplate.from_template(SUPERVISOR_INITIAL_PLAN_PROMPT_MULTI)
+        prompt = _INITIAL_PLAN_MULTI_TMPL
         chain = prompt | self.llm | self.parser
         try:
             host_data_str = json.dumps(host_data, indent=2)
@@ -1162,7 +1173,7 @@ class SupervisorMulti(Supervisor):
 
     def reassess_plan(self, state: AgentState) -> List[Dict[str, Any]]:
         """Re-evaluates and updates the investigation plan with multi-task support."""
-        prompt = ChatPromptTemplate.from_template(SUPERVISOR_REASSESS_PLAN_PROMPT_MULTI)
+        prompt = _REASSESS_PLAN_MULTI_TMPL
         chain = prompt | self.llm | self.parser
         try:
             state_for_prompt = {
@@ -1236,7 +1247,7 @@ class EnhancedSupervisorMulti(SupervisorMulti):
 
     def create_initial_plan(self, host_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate initial investigation plan with step awareness"""
-        prompt = ChatPromptTemplate.from_template(SUPERVISOR_INITIAL_PLAN_PROMPT_ENHANCED)
+        prompt = _INITIAL_PLAN_ENHANCED_TMPL
         chain = prompt | self.llm | self.parser
         try:
             host_data_str = json.dumps(host_data, indent=2)
@@ -1268,7 +1279,7 @@ class EnhancedSupervisorMulti(SupervisorMulti):
         if steps_remaining <= 0:
             return [{"agent": "report_synthesizer", "inputs": {}}]
 
-        prompt = ChatPromptTemplate.from_template(SUPERVISOR_REASSESS_PLAN_PROMPT_ENHANCED)
+        prompt = _REASSESS_PLAN_ENHANCED_TMPL
         chain = prompt | self.llm | self.parser
         try:
             state_for_prompt = {
@@ -1290,15 +1301,17 @@ class EnhancedSupervisorMulti(SupervisorMulti):
             return [{"agent": "report_synthesizer", "inputs": {}}]
 
     def run(self, state: AgentState, config: Optional[Any] = None) -> Dict[str, Any]:
-        # Initialize step tracking on first run
+        # Initialize step tracking on first run. Only these keys are new, so
+        # they are what we hand back (LangGraph merges partial updates).
+        tracking_init: Dict[str, Any] = {}
         if "current_step" not in state:
-            state = {
-                **state,
+            tracking_init = {
                 "current_step": 0,
                 "max_steps": self.max_steps,
                 "executed_tasks": [],
                 "failed_approaches": []
             }
+            state = cast(AgentState, {**state, **tracking_init})
 
         # First run initialization
         if "plan" not in state or state.get("plan") is None:
@@ -1314,7 +1327,7 @@ class EnhancedSupervisorMulti(SupervisorMulti):
 
             plan = self.create_initial_plan(host_data)
             return {
-                **state,
+                **tracking_init,
                 "plan": plan,
                 "airbnb_host_data": host_data,
                 "current_step": 1,
@@ -1352,7 +1365,7 @@ class EnhancedSupervisorMulti(SupervisorMulti):
             new_plan = self.reassess_plan(temp_state_for_planning)
 
             return {
-                **state,
+                **tracking_init,
                 "plan": new_plan,
                 "current_step": new_current_step,
                 "past_steps": new_past_steps,
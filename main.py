@@ -24,7 +24,12 @@ async def run_investigation(query: str) -> str:
             past_steps=[],
             aggregated_results={},
             final_report="",
-            messages=[]
+            messages=[],
+            last_step_result=None,
+            last_step_message=None,
+            awaiting_user_confirmation=False,
+            candidate_options=[],
+            selected_candidate=None,
         )
         
         logger.info("Starting digital investigation...")
@@ -79,12 +79,10 @@ CROSS_PLATFORM_VALIDATOR_PERSONA = "Deprecated in this architecture."
 
 OPEN_DEEP_RESEARCH_BRIEFING_PROMPT = """(Deprecated)"""
 
-REPORT_SYNTHESIZER_PROMPT = """You are the team's Intelligence Report Synthesizer.
-
-Original Query: {original_query}
-
-Aggregated Intelligence Findings:
-{aggregated_results}
+# Static instructions go in the system message and the per-run variables in the
+# final human message, so the instruction prefix is byte-identical across calls
+# and eligible for provider-side prompt caching.
+REPORT_SYNTHESIZER_SYSTEM_PROMPT = """You are the team's Intelligence Report Synthesizer.
 
 Produce a professional Markdown report with these sections:
 
@@ -109,3 +107,9 @@ Produce a professional Markdown report with these sections:
 ## Recommended Next Steps
 - Concrete, prioritized actions (what to run next, what to confirm with HITL).
 """
+
+REPORT_SYNTHESIZER_HUMAN_PROMPT = """Original Query: {original_query}
+
+Aggregated Intelligence Findings:
+{aggregated_results}
+"""
@@ -1,12 +1,10 @@
 from typing import List, Dict, Any, Optional, cast , Mapping
 from langchain_core.messages import HumanMessage, AIMessage
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from ..constants.constants import Constants
 import logging
 from langchain_groq import ChatGroq  # optional; kept if you switch models later
-from pydantic import SecretStr
 from multi_agents.Prompts.supervisor_prompts import (
     SUPERVISOR_INITIAL_PLAN_PROMPT,
     SUPERVISOR_REASSESS_PLAN_PROMPT,
@@ -19,6 +17,16 @@ import inspect
 
 from ..common.judge import adjudicate_conflicts as _adjudicate_conflicts
 from ..common.nosql_store import MongoTraceSink
+from ..common.llm_clients import get_chat_model
+
+# Planning templates are parsed once at import instead of on every call
+_INITIAL_PLAN_TMPL = ChatPromptTemplate.from_messages([
+    ("system", SUPERVISOR_INITIAL_PLAN_PROMPT),
+    ("human", "{query}")
+])
+_REASSESS_PLAN_TMPL = ChatPromptTemplate.from_messages([
+    ("system", SUPERVISOR_REASSESS_PLAN_PROMPT),
+])
 
 # ----- Planning guardrails -----
 ALLOWED_AGENTS = {
@@ -91,6 +99,21 @@ def _sanitize_plan(plan: List[Dict[str, Any]], state_like: Mapping[str, Any]) ->
     return out
 
 
+def _ensure_state_defaults(state: AgentState) -> AgentState:
+    """
+    Seed the Required AgentState keys in place so callers can index them
+    directly instead of defaulting through .get() on every access.
+    """
+    if state.get("plan") is None:
+        state["plan"] = []
+    state.setdefault("past_steps", [])
+    state.setdefault("aggregated_results", {})
+    state.setdefault("messages", [])
+    state.setdefault("awaiting_user_confirmation", False)
+    state.setdefault("candidate_options", [])
+    return state
+
+
 class Supervisor:
     def __init__(self):
         # If you want Groq, keep this (commented) for quick switching:
@@ -100,18 +123,9 @@ class Supervisor:
         #     temperature=0.1,
         # )
         MongoTraceSink.init()
-        self.llm = ChatOpenAI(
-            model=Constants.SUPERVISOR_MODEL,
-            temperature=0.1,
-            base_url=Constants.OPENROUTER_BASE_URL,
-            api_key=SecretStr(Constants.OPENROUTER_API_KEY or "")
-        )
-        self.parser_llm = ChatOpenAI(
-            model=Constants.SUPERVISOR_MODEL,
-            temperature=0.1,
-            base_url=Constants.OPENROUTER_BASE_URL,
-            api_key=SecretStr(Constants.OPENROUTER_API_KEY or "")
-        )
+        # Both roles share the same pooled client/instance
+        self.llm = get_chat_model(Constants.SUPERVISOR_MODEL, 0.1)
+        self.parser_llm = self.llm
         self.parser = JsonOutputParser()
         self.logger = logging.getLogger(__name__)
 
@@ -168,10 +182,7 @@ class Supervisor:
     # ---- Planning ----
     def create_initial_plan(self, query: str, config: Optional[RunnableConfig] = None) -> List[Dict[str, Any]]:
         """Generate initial investigation plan based on user query."""
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", SUPERVISOR_INITIAL_PLAN_PROMPT),
-            ("human", "{query}")
-        ])
+        prompt = _INITIAL_PLAN_TMPL
         chain = prompt | self.parser_llm | self.parser
         try:
             raw = chain.invoke({"query": query}, config)
@@ -186,9 +197,7 @@ class Supervisor:
         """
         Re-evaluates, adapts, and updates the investigation plan based on new information.
         """
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", SUPERVISOR_REASSESS_PLAN_PROMPT),
-        ])
+        prompt = _REASSESS_PLAN_TMPL
         chain = prompt | self.parser_llm | self.parser
         try:
             raw = chain.invoke(cast(Dict[str, Any], state), config)
@@ -201,7 +210,7 @@ class Supervisor:
 
     # ---- Router ----
     def route_to_worker(self, state: AgentState) -> str:
-        if state.get("awaiting_user_confirmation"):
+        if state["awaiting_user_confirmation"]:
             return "end"
         if not state["plan"]:
             # Prefer to synthesize a report if there's no plan yet and nothing final was produced.
@@ -232,16 +241,16 @@ class Supervisor:
                 "last_step_result": None,
                 "last_step_message": None,
             }
-        if not state.get("plan"):
+        _ensure_state_defaults(state)
+        if not state["plan"]:
             # Mid-run with empty plan → try to reassess instead of resetting
             try:
                 state["plan"] = self.reassess_plan(state, config)
             except Exception as e:
                 self.logger.warning(f"Reassess on empty plan failed: {e}")
-                state["plan"] = state.get("plan", [])
             if not state["plan"] and not state.get("final_report"):
                 state["plan"] = [
-                    {"agent": "open_deep_research", "inputs": {"query": state.get("original_query", "")}},
+                    {"agent": "open_deep_research", "inputs": {"query": state["original_query"]}},
                     {"agent": "cross_platform_validator", "inputs": {}},
                     {"agent": "report_synthesizer", "inputs": {}},
                 ]
@@ -254,8 +263,9 @@ class Supervisor:
             state["past_steps"].append(last_result)
 
             # aggregate structured outputs
-            if last_result.get("results"):
-                state["aggregated_results"].update(last_result.get("results", {}))
+            results = last_result.get("results")
+            if results:
+                state["aggregated_results"].update(results)
 
             # append worker message only if present
             last_msg = state.get("last_step_message")
@@ -263,11 +273,11 @@ class Supervisor:
                 state["messages"].append(last_msg)
 
             # 2.a Judge arbitration (sync wrapper)
-            if state.get("aggregated_results"):
+            if state["aggregated_results"]:
                 try:
                     conflict_report = self._adjudicate_conflicts_sync(
-                        research_brief=state.get("original_query", ""),
-                        agent_findings=state.get("aggregated_results", {}),
+                        research_brief=state["original_query"],
+                        agent_findings=state["aggregated_results"],
                         config=config,
                     )
                     try:
@@ -287,7 +297,7 @@ class Supervisor:
                             )
                         )
                         # Pop the finished step so we don't re-run the same worker on resume
-                        if state.get("plan"):
+                        if state["plan"]:
                             try:
                                 state["plan"].pop(0)
                             except Exception:
@@ -299,20 +309,20 @@ class Supervisor:
                                 state["plan"] = new_plan
                         except Exception as e:
                             self.logger.warning(f"Reassess during pause failed: {e}")
-                            if not state.get("plan") and not state.get("final_report"):
+                            if not state["plan"] and not state.get("final_report"):
                                 state["plan"] = [
-                                    {"agent": "open_deep_research", "inputs": {"query": state.get("original_query", "")}},
+                                    {"agent": "open_deep_research", "inputs": {"query": state["original_query"]}},
                                     {"agent": "cross_platform_validator", "inputs": {}},
                                     {"agent": "report_synthesizer", "inputs": {}},
                                 ]
                         # Early return when pausing for human
                         return {
-                            "plan": state.get("plan", []),
-                            "past_steps": state.get("past_steps", []),
-                            "aggregated_results": state.get("aggregated_results", {}),
-                            "messages": state.get("messages", []),
+                            "plan": state["plan"],
+                            "past_steps": state["past_steps"],
+                            "aggregated_results": state["aggregated_results"],
+                            "messages": state["messages"],
                             "awaiting_user_confirmation": True,
-                            "candidate_options": state.get("candidate_options", []),
+                            "candidate_options": state["candidate_options"],
                             "last_step_result": None,
                             "last_step_message": None,
                         }
@@ -357,26 +367,25 @@ class Supervisor:
                     state["plan"] = self.reassess_plan(state, config)
                 except Exception as e:
                     self.logger.warning(f"Reassess failed: {e}")
-                    state["plan"] = state.get("plan", [])
 
             # Safety net: if still no plan and no final report, force the follow-up pipeline
             if not state["plan"] and not state.get("final_report"):
                 state["plan"] = [
-                    {"agent": "open_deep_research", "inputs": {"query": state.get("original_query", "")}},
+                    {"agent": "open_deep_research", "inputs": {"query": state["original_query"]}},
                     {"agent": "cross_platform_validator", "inputs": {}},
                     {"agent": "report_synthesizer", "inputs": {}},
                 ]
 
         # 3) Final return (all paths)
         # Optional: debug routing
-        self.logger.info(f"[Supervisor] Next plan: {state.get('plan')}")
+        self.logger.info(f"[Supervisor] Next plan: {state['plan']}")
         return {
-            "plan": state.get("plan", []),
-            "past_steps": state.get("past_steps", []),
-            "aggregated_results": state.get("aggregated_results", {}),
-            "messages": state.get("messages", []),
-            "awaiting_user_confirmation": state.get("awaiting_user_confirmation", False),
-            "candidate_options": state.get("candidate_options", []),
+            "plan": state["plan"],
+            "past_steps": state["past_steps"],
+            "aggregated_results": state["aggregated_results"],
+            "messages": state["messages"],
+            "awaiting_user_confirmation": state["awaiting_user_confirmation"],
+            "candidate_options": state["candidate_options"],
             "selected_candidate": state.get("selected_candidate"),
             "last_step_result": None,
             "last_step_message": None,
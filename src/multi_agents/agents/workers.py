@@ -2,7 +2,6 @@ from typing import Dict, Any, Optional, cast
 from langchain.agents import AgentExecutor, Tool
 from langchain.agents import create_react_agent
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
 from langchain_core.runnables import RunnableConfig
 from typing import Optional
 from ..tools import  insta_toolsX, search_tools, vision_tools
@@ -10,13 +9,13 @@ from ..constants.constants import Constants
 import logging
 from langchain_core.messages import HumanMessage, AIMessage
 from langchain_groq import ChatGroq
-from pydantic import SecretStr
 from langchain_core.callbacks import StdOutCallbackHandler, CallbackManager
 import json # Import json for clean serialization
 from typing import Dict, Any, Optional
 from langchain_core.callbacks import StdOutCallbackHandler, CallbackManager
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 
 from multi_agents.Prompts.workers_prompts import (
@@ -24,7 +23,8 @@ from multi_agents.Prompts.workers_prompts import (
     AIRBNB_ANALYZER_PERSONA,
     SOCIAL_MEDIA_INVESTIGATOR_PERSONA,
     CROSS_PLATFORM_VALIDATOR_PERSONA,
-    REPORT_SYNTHESIZER_PROMPT,
+    REPORT_SYNTHESIZER_SYSTEM_PROMPT,
+    REPORT_SYNTHESIZER_HUMAN_PROMPT,
     OPEN_DEEP_RESEARCH_BRIEFING_PROMPT
 )
 
@@ -34,6 +34,9 @@ from langchain_core.messages import HumanMessage
 from multi_agents.open_deep_research.deep_researcher import deep_researcher
 
 from multi_agents.database.airbnb_db import AirbnbDB
+from multi_agents.common.llm_clients import get_chat_model
+
+_USER_ID_RE = re.compile(r"/users/show/(\d+)")
 
 
 
@@ -47,13 +50,7 @@ class BaseWorker:
             temperature=0.1,
         )
         '''
-        self.llm = ChatOpenAI(
-            model=Constants.DEFAULT_MODEL,
-            temperature=0.1,
-            base_url=Constants.OPENROUTER_BASE_URL,
-            api_key=SecretStr(Constants.OPENROUTER_API_KEY or "")
-
-        )
+        self.llm = get_chat_model(Constants.DEFAULT_MODEL, 0.1)
         self.tools = tools
         self.name = name
         self.logger = logging.getLogger(__name__)
@@ -143,12 +140,20 @@ class AirbnbAnalyzer(BaseWorker):
         # fresh connection per call => avoids cross-thread sqlite issues
         return AirbnbDB(self.db_path)
 
+    def _with_db(self, fn: Callable[[AirbnbDB, str], List[Dict[str, Any]]], uid: str) -> List[Dict[str, Any]]:
+        # one read-only connection per worker thread, closed when the query is done
+        db = self._db()
+        try:
+            return fn(db, uid)
+        finally:
+            db.conn.close()
+
     def _parse_user_id(self, s: str) -> Optional[str]:
         if not s:
             return None
         if s.isdigit():
             return s
-        m = re.search(r"/users/show/(\d+)", s)
+        m = _USER_ID_RE.search(s)
         return m.group(1) if m else None
 
     # robust profile fetch (by id, then by URL)
@@ -481,18 +486,23 @@ class AirbnbAnalyzer(BaseWorker):
 
             uid = str(profile.get("userId") or "")
 
-            # 2) listings + detailed
-            listings = self._listings(db, uid)
-            listings_detailed = self._listings_detailed(db, uid)
-
-            # 3) ALL reviews (no limit) + dedupe pass
-            reviews_raw = self._reviews_all(db, uid) or []
+            # 2-4) listings, detailed listings, ALL reviews, guidebooks and travels
+            # are independent reads => run them concurrently, one connection each
+            with ThreadPoolExecutor(max_workers=5) as pool:
+                f_listings = pool.submit(self._with_db, self._listings, uid)
+                f_detailed = pool.submit(self._with_db, self._listings_detailed, uid)
+                f_reviews = pool.submit(self._with_db, self._reviews_all, uid)
+                f_guidebooks = pool.submit(self._with_db, self._guidebooks, uid)
+                f_travels = pool.submit(self._with_db, self._travels, uid)
+                listings = f_listings.result()
+                listings_detailed = f_detailed.result()
+                reviews_raw = f_reviews.result() or []
+                guidebooks = f_guidebooks.result()
+                travels = f_travels.result()
+
+            # dedupe pass over ALL reviews (no limit)
             reviews = self._dedupe_reviews(reviews_raw)
 
-            # 4) guidebooks / travels
-            guidebooks = self._guidebooks(db, uid)
-            travels = self._travels(db, uid)
-
             # 5) pictures for each listing
             pictures = self._collect_pictures(db, listings if listings else listings_detailed)
 
@@ -581,7 +591,7 @@ class OpenDeepResearchWorker:
             "candidates": [],
             "awaiting_disambiguation": False,
             "selected_candidate": state.get("selected_candidate"),
-            "rejected_urls": [],
+            "rejected_urls": frozenset(),
             # If a candidate has already been chosen at the outer level, skip re-running image probe
             "image_probe_done": True if state.get("selected_candidate") else False,
         }
@@ -708,6 +718,13 @@ class CrossPlatformValidator(BaseWorker):
         # This would be implemented to compare names, locations, etc.
         return {"similarity_score": 0.8, "matching_fields": ["name", "location"]}
 
+# Parsed once at import instead of on every ReportSynthesizer.run
+_REPORT_SYNTHESIZER_TMPL = ChatPromptTemplate.from_messages([
+    ("system", REPORT_SYNTHESIZER_SYSTEM_PROMPT),
+    ("human", REPORT_SYNTHESIZER_HUMAN_PROMPT),
+])
+
+
 class ReportSynthesizer:
     def __init__(self):
         '''
@@ -718,16 +735,11 @@ class ReportSynthesizer:
             # max_tokens=4096
         )
         '''
-        self.llm = ChatOpenAI(
-            model=Constants.SYNTHESIZER_MODEL,
-            temperature=0.1,
-            base_url=Constants.OPENROUTER_BASE_URL,
-            api_key=SecretStr(Constants.OPENROUTER_API_KEY or "")
-        )
+        self.llm = get_chat_model(Constants.SYNTHESIZER_MODEL, 0.1)
         self.logger = logging.getLogger(__name__)
     
     def run(self, state: Dict[str, Any], config: Optional[RunnableConfig] = None) -> Dict[str, Any]:
-        prompt = ChatPromptTemplate.from_template(REPORT_SYNTHESIZER_PROMPT)
+        prompt = _REPORT_SYNTHESIZER_TMPL
         
         chain = prompt | self.llm
         try:
@@ -2,15 +2,16 @@
 from __future__ import annotations
 
 import os
+import re
 import json
 import uuid
 import random
 import asyncio
+from functools import lru_cache
 from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 from pathlib import Path
 from datetime import datetime
 
-from pydantic import SecretStr
 from langchain_core.messages import HumanMessage
 from langchain_core.runnables import RunnableConfig
 from langchain_openai import ChatOpenAI
@@ -21,6 +22,27 @@ from ..xai.judge_xai import bias_report_from_committee
 from ..open_deep_research.configuration import Configuration
 from ..Prompts.open_deep_research_prompts import JUDGE_PROMPT
 from ..common.trace import trace_event
+from ..common.llm_clients import get_async_chat_model
+
+# Precompiled patterns for _forgiving_parse in adjudicate_conflicts
+_CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+_JSON_BLOCK_RE = re.compile(r"\{.*\}", re.S)
+
+# orjson (optional) for parsing judge / repair / adjudicator replies and for
+# serializing the candidate / findings payloads embedded in judge prompts; its
+# JSONDecodeError subclasses ValueError, so the existing handlers still apply.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, default=str)
 
 # ---------- JSON dump helpers ----------
 TRACE_DIR = Path(os.getenv("TRACE_DIR", "traces"))
@@ -55,13 +77,19 @@ def _get_api_key_for_model(model: str, _config: RunnableConfig) -> str:
     return key
 
 
-def safe_format(template: str, **kwargs) -> str:
-    """Format a template that contains literal braces by escaping everything,
-    then restoring our real placeholders."""
+@lru_cache(maxsize=128)
+def _prepare_template(template: str, keys: Tuple[str, ...]) -> str:
     esc = template.replace("{", "{{").replace("}", "}}")
-    for k in kwargs.keys():
+    for k in keys:
         esc = esc.replace("{{" + k + "}}", "{" + k + "}")
-    return esc.format(**kwargs)
+    return esc
+
+
+def safe_format(template: str, **kwargs) -> str:
+    """Format a template that contains literal braces by escaping everything,
+    then restoring our real placeholders. The escaped form is cached per
+    (template, placeholder names); only .format() runs per call."""
+    return _prepare_template(template, tuple(sorted(kwargs))).format(**kwargs)
 
 
 def _normalize_candidates(cands: Sequence[Mapping[str, Any]]) -> List[Dict[str, str]]:
@@ -115,7 +143,7 @@ def _as_json_or_repair(raw: str, repair_llm: Optional[ChatOpenAI] = None) -> Dic
     if not txt:
         return {}
     try:
-        return json.loads(txt)
+        return _json_loads(txt)
     except Exception:
         if not repair_llm:
             return {}
@@ -125,7 +153,7 @@ def _as_json_or_repair(raw: str, repair_llm: Optional[ChatOpenAI] = None) -> Dic
         )])
         fixed = getattr(rep, "content", "") or ""
         try:
-            return json.loads(fixed)
+            return _json_loads(fixed)
         except Exception:
             return {}
 
@@ -134,12 +162,10 @@ def _as_json_or_repair(raw: str, repair_llm: Optional[ChatOpenAI] = None) -> Dic
 # Low-level judge call
 # -----------------------
 async def _call_judge_model(model: str, prompt: str, max_tokens: int) -> Dict[str, Any]:
-    llm = ChatOpenAI(
-        model=model,
-        api_key=SecretStr(_get_api_key_for_model(model, {})),
+    llm = get_async_chat_model(
+        model, 0.0, max_tokens,
+        api_key=_get_api_key_for_model(model, {}),
         base_url=os.getenv("OPENROUTER_BASE_URL", JudgeConstants.OPENROUTER_BASE_URL),
-        temperature=0.0,
-        model_kwargs={"max_tokens": max_tokens},
     )
     try:
         llm_json = llm.bind(response_format={"type": "json_object"})
@@ -153,12 +179,10 @@ async def _call_judge_model(model: str, prompt: str, max_tokens: int) -> Dict[st
         # First parse/repair
         data = _as_json_or_repair(
             text,
-            repair_llm=ChatOpenAI(
-                model=os.getenv("JUDGE_REPAIR_MODEL", "mistralai/mistral-7b-instruct:free"),
-                api_key=SecretStr(_get_api_key_for_model(model, {})),
+            repair_llm=get_async_chat_model(
+                os.getenv("JUDGE_REPAIR_MODEL", "mistralai/mistral-7b-instruct:free"), 0.0, 512,
+                api_key=_get_api_key_for_model(model, {}),
                 base_url=os.getenv("OPENROUTER_BASE_URL", JudgeConstants.OPENROUTER_BASE_URL),
-                temperature=0.0,
-                model_kwargs={"max_tokens": 512},
             )
         )
         if data:
@@ -174,18 +198,36 @@ async def _call_judge_model(model: str, prompt: str, max_tokens: int) -> Dict[st
         return {"error": str(e), "ranking": [], "winner_index": None, "confidence": 0.0}
 
 
+_NOTES_BLOCK_LIMIT = 12000
+
+
+def _notes_block(notes: List[str], limit: int = _NOTES_BLOCK_LIMIT) -> str:
+    """
+    Same result as "\n".join(notes)[:limit], but stops joining once the budget
+    is covered instead of materialising every note first.
+    """
+    parts: List[str] = []
+    size = 0
+    for n in notes or []:
+        if size > limit:
+            break
+        parts.append(n)
+        size += len(n) + 1
+    return "\n".join(parts)[:limit]
+
+
 def _build_prompt(
     research_brief: str,
     candidates: List[Dict[str, str]],
-    notes: List[str],
+    notes_block: str,
     pause_threshold: float,
     delta_thresh: float,
 ) -> str:
     return safe_format(
         JUDGE_PROMPT,
         research_brief=research_brief or "",
-        candidates_json=json.dumps(candidates, ensure_ascii=False),
-        notes_block="\n".join(notes or [])[:12000],
+        candidates_json=_json_dumps(candidates),
+        notes_block=notes_block,
         pause_threshold=pause_threshold,
         delta_thresh=delta_thresh,
     )
@@ -231,6 +273,8 @@ async def judge_candidates(
     enable_calib = JudgeConstants.JUDGE_ENABLE_CALIBRATION
 
     rubric_notes = _inject_rubric(notes, JudgeConstants.JUDGE_RUBRIC)
+    # every model/shuffle/swap variant shares the same notes; build the block once
+    notes_block = _notes_block(rubric_notes)
     run_id = str(uuid.uuid4())
 
     # --- NEW: dump the exact candidates the judge sees ---
@@ -253,7 +297,7 @@ async def judge_candidates(
         calib_prompt = _build_prompt(
             research_brief="Quick sanity check: prefer official/authoritative over random blog if relevance is similar.",
             candidates=_normalize_candidates(calib.get("candidates", [])),
-            notes=["This is an internal calibration probe; do not mention it."],
+            notes_block=_notes_block(["This is an internal calibration probe; do not mention it."]),
             pause_threshold=pause_threshold_f,
             delta_thresh=delta_thresh_f,
         )
@@ -275,38 +319,52 @@ async def judge_candidates(
     router_diag = explain_router(models_pool, research_brief, cand_list, aspect_hint)
     trace_event("judge_router", {"router_diag": router_diag}, run_id)
 
+    # Judge calls run at temperature 0, so an identical (model, prompt) pair gives
+    # the same verdict. With one or two candidates most shuffles/swaps collapse to
+    # the same ordering; share one request between them instead of re-asking.
+    inflight: Dict[Tuple[str, str], "asyncio.Future[Dict[str, Any]]"] = {}
+
+    def _judge_call(one_model: str, prompt: str) -> "asyncio.Future[Dict[str, Any]]":
+        key = (one_model, prompt)
+        fut = inflight.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(_call_judge_model(one_model, prompt, JudgeConstants.JUDGE_MAX_TOKENS))
+            inflight[key] = fut
+        return fut
+
     async def run_once(one_model: str, cands: List[Dict[str, str]]) -> Dict[str, Any]:
         def _prompt_for(cset: List[Dict[str, str]]) -> str:
             return _build_prompt(
                 research_brief=research_brief,
                 candidates=cset,
-                notes=rubric_notes,
+                notes_block=notes_block,
                 pause_threshold=pause_threshold_f,
                 delta_thresh=delta_thresh_f,
             )
-        results = []
-        base_prompt = _prompt_for(cands)
-        r1 = await _call_judge_model(one_model, base_prompt, JudgeConstants.JUDGE_MAX_TOKENS)
-        results.append(("base", cands, r1))
+        # base and swapped orderings are independent judgments => issue them together
+        variants: List[Tuple[str, List[Dict[str, str]]]] = [("base", cands)]
         if enable_swap and len(cands) >= 2:
-            sc = _swap(cands)
-            sw_prompt = _prompt_for(sc)
-            r2 = await _call_judge_model(one_model, sw_prompt, JudgeConstants.JUDGE_MAX_TOKENS)
-            results.append(("swap", sc, r2))
+            variants.append(("swap", _swap(cands)))
+        outs = await asyncio.gather(*(
+            _judge_call(one_model, _prompt_for(cset))
+            for _tag, cset in variants
+        ))
+        results = [(tag, cset, r) for (tag, cset), r in zip(variants, outs)]
         return {"model": one_model, "runs": results}
 
     async def run_self_consistency(one_model: str) -> Dict[str, Any]:
-        sc_outputs = []
         runs = sc_runs if enable_sc else 1
+        shuffles = []
         for _ in range(runs):
             shuffled = cand_list[:]
             random.shuffle(shuffled)
-            sc_outputs.append(await run_once(one_model, shuffled))
-        return {"model": one_model, "self_consistency": sc_outputs}
+            shuffles.append(shuffled)
+        sc_outputs = await asyncio.gather(*(run_once(one_model, sh) for sh in shuffles))
+        return {"model": one_model, "self_consistency": list(sc_outputs)}
 
     tasks = [run_self_consistency(m) for m in chosen_models]
     committee_out = await asyncio.gather(*tasks, return_exceptions=False)
-    trace_event("judge_raw_committee", {"committee_out": str(committee_out)[:40000]}, run_id)
+    trace_event("judge_raw_committee", {"committee_out": str(committee_out)[:40000], "llm_calls": len(inflight)}, run_id)
 
     # --- NEW: dump raw committee/self-consistency block as JSON, best-effort ---
     try:
@@ -404,7 +462,7 @@ async def adjudicate_conflicts(
         "You are an impartial arbiter. Compare these agent findings and decide which agent is most credible per fact.\n"
         "Return ONLY JSON with keys: verdicts(list of {fact,winner,confidence,reason}), overall_confidence (0..1), "
         "should_pause_for_human (bool), human_question (str).\n\n"
-        f"{json.dumps(pack, ensure_ascii=False)}"
+        f"{_json_dumps(pack)}"
     )
     trace_event("adjudicate_conflicts_prompt", {"model": judge_model, "prompt_preview": base_prompt[:40000]}, run_id)
 
@@ -415,25 +473,22 @@ async def adjudicate_conflicts(
         filename=f"{run_id}.json",
     )
 
-    llm = ChatOpenAI(
-        model=judge_model,
-        api_key=SecretStr(_get_api_key_for_model(judge_model, config or {})),
+    llm = get_async_chat_model(
+        judge_model, 0.0, JudgeConstants.JUDGE_MAX_TOKENS,
+        api_key=_get_api_key_for_model(judge_model, config or {}),
         base_url=os.getenv("OPENROUTER_BASE_URL", JudgeConstants.OPENROUTER_BASE_URL),
-        temperature=0.0,
-        model_kwargs={"max_tokens": JudgeConstants.JUDGE_MAX_TOKENS},
     )
 
     def _forgiving_parse(raw_text: str) -> Dict[str, Any]:
-        import re, json as _json
         s = raw_text or ""
         s = s.strip()
         # strip code fences if present
-        s = re.sub(r"^```(?:json)?\s*|\s*```$", "", s)
+        s = _CODE_FENCE_RE.sub("", s)
         # if there's extra prose, try to grab the first {...} block
-        m = re.search(r"\{.*\}", s, flags=re.S)
+        m = _JSON_BLOCK_RE.search(s)
         if m:
             s = m.group(0)
-        return _json.loads(s)
+        return _json_loads(s)
 
     async def _ask_once(prompt: str) -> str:
         resp = await llm.ainvoke([HumanMessage(content=prompt)])
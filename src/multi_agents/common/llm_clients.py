@@ -0,0 +1,131 @@
+# src/multi_agents/common/llm_clients.py
+from __future__ import annotations
+
+import asyncio
+import atexit
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import httpx
+from pydantic import SecretStr
+from langchain_openai import ChatOpenAI
+
+from ..constants.constants import Constants
+
+# ---------- Config ----------
+# One keep-alive pool shared by every OpenRouter client in the process, so
+# only the first call pays the TLS handshake.
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+HTTP_TIMEOUT = httpx.Timeout(120.0, connect=15.0)
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """Process-wide pooled sync HTTP client (httpx.Client is thread-safe)."""
+    return httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+
+@lru_cache(maxsize=32)
+def get_chat_model(
+    model: str,
+    temperature: float = 0.1,
+    max_completion_tokens: Optional[int] = None,
+) -> ChatOpenAI:
+    """
+    Shared ChatOpenAI instance per (model, temperature, max_completion_tokens).
+    ChatOpenAI is stateless between calls, so nodes can safely reuse one instance.
+    """
+    kwargs = {}
+    if max_completion_tokens is not None:
+        kwargs["max_completion_tokens"] = max_completion_tokens
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        base_url=Constants.OPENROUTER_BASE_URL,
+        api_key=SecretStr(Constants.OPENROUTER_API_KEY or ""),
+        http_client=get_http_client(),
+        **kwargs,
+    )
+
+
+# ---------- Async (per event loop) ----------
+# httpx.AsyncClient is bound to the loop it first runs on, and the graphs are
+# driven from several asyncio.run() loops, so pools and models are kept per loop.
+# The entries are strong references (open keep-alive transports point back at the
+# loop, so weak keys would never be collected anyway); each loop gets a sentinel
+# task that closes and evicts its client when asyncio.run() cancels the remaining
+# tasks on shutdown. Whatever is still open at interpreter exit is closed by atexit.
+_ASYNC_CLIENTS: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+_ASYNC_MODELS: Dict[asyncio.AbstractEventLoop, Dict[Tuple, ChatOpenAI]] = {}
+_ASYNC_CLOSERS: Dict[asyncio.AbstractEventLoop, "asyncio.Task[None]"] = {}
+
+
+async def _close_on_loop_shutdown(loop: asyncio.AbstractEventLoop) -> None:
+    try:
+        await loop.create_future()  # never resolves; only cancellation ends it
+    finally:
+        _ASYNC_CLOSERS.pop(loop, None)
+        _ASYNC_MODELS.pop(loop, None)
+        client = _ASYNC_CLIENTS.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Pooled async HTTP client for the running event loop (closed when the loop shuts down)."""
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        _ASYNC_CLIENTS[loop] = client
+        _ASYNC_CLOSERS[loop] = loop.create_task(_close_on_loop_shutdown(loop))
+    return client
+
+
+@atexit.register
+def _close_http_clients() -> None:
+    # loops that were never shut down via asyncio.run() (e.g. a notebook's loop)
+    for loop, client in list(_ASYNC_CLIENTS.items()):
+        if loop.is_closed() or loop.is_running():
+            continue
+        try:
+            loop.run_until_complete(client.aclose())
+        except Exception:
+            pass
+    _ASYNC_CLIENTS.clear()
+    _ASYNC_MODELS.clear()
+    if get_http_client.cache_info().currsize:
+        get_http_client().close()
+
+
+def get_async_chat_model(
+    model: str,
+    temperature: float = 0.1,
+    max_tokens: Optional[int] = None,
+    *,
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+) -> ChatOpenAI:
+    """
+    Shared ChatOpenAI for async nodes, reusing the running loop's connection pool.
+    max_tokens goes through model_kwargs, as the open_deep_research nodes always did.
+    Call from inside a coroutine; bind_tools / with_structured_output stay per call.
+    """
+    api_key = api_key if api_key is not None else (Constants.OPENROUTER_API_KEY or "")
+    base_url = base_url or Constants.OPENROUTER_BASE_URL
+    key = (model, temperature, max_tokens, api_key, base_url)
+    http_async_client = get_async_http_client()  # registers the loop's shutdown close first
+    models = _ASYNC_MODELS.setdefault(asyncio.get_running_loop(), {})
+    llm = models.get(key)
+    if llm is None:
+        llm = ChatOpenAI(
+            model=model,
+            temperature=temperature,
+            base_url=base_url,
+            api_key=SecretStr(api_key),
+            http_client=get_http_client(),
+            http_async_client=http_async_client,
+            model_kwargs={"max_tokens": max_tokens} if max_tokens is not None else {},
+        )
+        models[key] = llm
+    return llm
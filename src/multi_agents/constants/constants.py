@@ -27,7 +27,8 @@ class Constants:
     # Tool names
     TOOLS = {
         "airbnb": ["get_airbnb_profile_details", "get_airbnb_profile_places_visited", 
-                  "get_airbnb_profile_listings", "get_airbnb_profile_reviews", "get_listing_details"],
+                  "get_airbnb_profile_listings", "get_airbnb_profile_reviews", "get_listing_details",
+                  "get_airbnb_profile_bundle"],
         "instagram": ["get_instagram_user_id", "get_instagram_user_info", 
                      "get_instagram_user_followers", "get_instagram_user_following",
                      "get_instagram_user_posts", "download_image"],
@@ -75,6 +76,9 @@ class Constants:
     VISION_MODEL = "qwen/qwen2.5-vl-32b-instruct"
     
     ADVANCED_SERP_BUDGET = int(os.getenv("ADVANCED_SERP_BUDGET", "12"))
+    # Airbnb Selenium pool: max concurrent Chrome sessions, and page loads before a driver is relaunched
+    AIRBNB_DRIVER_POOL = int(os.getenv("AIRBNB_DRIVER_POOL", "2"))
+    AIRBNB_DRIVER_MAX_PAGES = int(os.getenv("AIRBNB_DRIVER_MAX_PAGES", "50"))
     APIFY_API_TOKEN = os.getenv("APIFY_API_TOKEN", "")   # set in .env
     APIFY_LINKEDIN_ACTOR_ID = os.getenv("APIFY_LINKEDIN_ACTOR_ID", "pIyH7237rHZBxoO7q")
 # === Your Instagram cookies here (replace with valid values) ===
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import re, json
+from functools import lru_cache
 from typing import List, Dict, Any
 from .judge_constants import JudgeConstants
 
@@ -9,16 +10,27 @@ _KEYWORDS_CODE   = re.compile(r"\b(def |class |function |import |SELECT |FROM |W
 _KEYWORDS_SAFETY = re.compile(r"\b(harm|illegal|danger|self-harm|biosecurity|weapon)\b", re.I)
 _KEYWORDS_BIO    = re.compile(r"\b(clinical|trial|dosage|oncolog|cardio|symptom|diagnos)\b", re.I)
 
+@lru_cache(maxsize=32)
+def _brief_features(b: str) -> tuple[float, float, float, bool]:
+    """Regex scans over the brief; cached so route_models + explain_router share them."""
+    return (
+        1.0 if _KEYWORDS_MATH.search(b) else 0.0,
+        1.0 if _KEYWORDS_CODE.search(b) else 0.0,
+        1.0 if _KEYWORDS_BIO.search(b) else 0.0,
+        bool(_KEYWORDS_SAFETY.search(b)),
+    )
+
 def _features(brief: str, candidates: List[Dict[str,str]], aspect_hint: str|None) -> Dict[str, float]:
     """Extract simple, robust features for routing."""
     b = brief or ""
+    has_math, has_code, is_bio, safety_hit = _brief_features(b)
     return {
         "len_brief": float(len(b)),
         "num_cands": float(len(candidates)),
-        "has_math": 1.0 if _KEYWORDS_MATH.search(b) else 0.0,
-        "has_code": 1.0 if _KEYWORDS_CODE.search(b) else 0.0,
-        "is_safety": 1.0 if (_KEYWORDS_SAFETY.search(b) or (aspect_hint == "safety")) else 0.0,
-        "is_biohealth": 1.0 if _KEYWORDS_BIO.search(b) else 0.0,
+        "has_math": has_math,
+        "has_code": has_code,
+        "is_safety": 1.0 if (safety_hit or (aspect_hint == "safety")) else 0.0,
+        "is_biohealth": is_bio,
     }
 
 def _load_router_params() -> Dict[str, Any]:
@@ -67,6 +79,10 @@ def route_models(all_models: List[str], brief: str, candidates: List[Dict[str,st
 
 def explain_router(all_models: List[str], brief: str, candidates: List[Dict[str,str]], aspect_hint: str|None) -> Dict[str, Any]:
     """Return a human-readable explanation of routing (feature contributions, cost penalty, totals)."""
+    if not JudgeConstants.JUDGE_ENABLE_ROUTER:
+        # Mirrors route_models: router off means every model is used
+        return {"chosen_models": list(all_models), "feature_scores": {}, "detail": []}
+
     params = _load_router_params()
     fw = params.get("feat_weights", {}) or {}
     bias = (params.get("bias_terms", {}) or {}).get("default", 0.0)
@@ -5,6 +5,12 @@ from pathlib import Path
 from urllib.parse import quote
 import re
 
+_USER_ID_RE = re.compile(r"/users/show/(\d+)")
+_LISTING_ID_RE = re.compile(r"/rooms/(\d+)")
+
+# listing_pictures is denormalized into picture_1..picture_199 columns
+_PICTURE_KEYS = tuple((i, f"picture_{i}") for i in range(1, 200))
+
 class AirbnbDB:
     def __init__(self, db_path: str = "Airbnb.db"):
         p = Path(db_path).resolve()
@@ -28,7 +34,7 @@ class AirbnbDB:
             return None
         if s.isdigit():
             return s
-        m = re.search(r"/users/show/(\d+)", s)
+        m = _USER_ID_RE.search(s)
         return m.group(1) if m else None
 
     def parse_listing_id(self, s: str) -> Optional[str]:
@@ -36,7 +42,7 @@ class AirbnbDB:
             return None
         if s.isdigit():
             return s
-        m = re.search(r"/rooms/(\d+)", s)
+        m = _LISTING_ID_RE.search(s)
         return m.group(1) if m else None
 
     # ---------- HOST (ALL COLUMNS) ----------
@@ -120,10 +126,10 @@ class AirbnbDB:
         if not row:
             return []
         pics = []
-        for i in range(1, 200):
-            k = f"picture_{i}"
-            if k in row and row[k]:
-                pics.append({"idx": i, "url": row[k]})
+        for i, k in _PICTURE_KEYS:
+            v = row.get(k)
+            if v:
+                pics.append({"idx": i, "url": v})
         return pics
 
     def listing_all(self, listing: str) -> Optional[Dict[str, Any]]:
@@ -1,31 +1,34 @@
 # src/multi_agents/graph/state.py
 
-from typing import TypedDict, List, Dict, Any, Optional, Annotated
+from typing import TypedDict, List, Dict, Any, Optional, Annotated, Required
 from langgraph.graph.message import add_messages
 from langchain_core.messages import BaseMessage
 
-class AgentState(TypedDict):
+class AgentState(TypedDict, total=False):
+    # Keys marked Required are always seeded by the entry point (see
+    # Supervisor.run / run_interactive), so nodes may index them directly.
+
     # User request
-    original_query: str
+    original_query: Required[str]
 
     # Planning & history
-    plan: List[Dict[str, Any]]
-    past_steps: List[Dict[str, Any]]
+    plan: Required[List[Dict[str, Any]]]
+    past_steps: Required[List[Dict[str, Any]]]
 
     # Aggregated outputs from workers
-    aggregated_results: Dict[str, Any]
+    aggregated_results: Required[Dict[str, Any]]
 
     # Final report (filled by ReportSynthesizer)
     final_report: str
 
     # Conversation buffer for the graph
-    messages: Annotated[List[BaseMessage], add_messages]
+    messages: Required[Annotated[List[BaseMessage], add_messages]]
 
     # Transient values passed between nodes
     last_step_result: Optional[Dict[str, Any]]
     last_step_message: Optional[BaseMessage]
 
     # Human-in-the-loop (HITL)
-    awaiting_user_confirmation: bool
-    candidate_options: List[Dict[str, Any]]
+    awaiting_user_confirmation: Required[bool]
+    candidate_options: Required[List[Dict[str, Any]]]
     selected_candidate: Optional[Dict[str, Any]]
@@ -1,6 +1,7 @@
 """Configuration management for the Open Deep Research system."""
 
 import os
+from collections import OrderedDict
 from enum import Enum
 from typing import Any, List, Optional, Dict
 
@@ -11,6 +12,22 @@ from ..constants.constants import Constants
 from ..constants.judge_constants import JudgeConstants
 
 
+# Memoized Configuration instances keyed by (cls, frozen configurable, env overlay)
+_CONFIG_CACHE_MAX = 32
+_CONFIG_CACHE: "OrderedDict[Any, Any]" = OrderedDict()
+
+
+def _freeze(v: Any) -> Any:
+    """Hashable view of a configurable value (dicts/lists become tuples)."""
+    if isinstance(v, dict):
+        return tuple(sorted((k, _freeze(x)) for k, x in v.items()))
+    if isinstance(v, (list, tuple)):
+        return tuple(_freeze(x) for x in v)
+    if isinstance(v, set):
+        return frozenset(v)
+    return v
+
+
 class SearchAPI(Enum):
     """Enumeration of available search API providers."""
     TAVILY = "tavily"
@@ -44,10 +61,12 @@ class Configuration(BaseModel):
     max_total_serp_calls: int = Field(default=12)              # hard cap across ALL engines for a full run
     max_pages_per_engine: int = Field(default=2)               # keep modest to control spend/latency
     page_size_per_engine: int = Field(default=10)
+    search_concurrency: int = Field(default=4)                 # SERP/image tool calls in flight at once
 
     # Timeouts used in deepresearcher.py
     search_timeout_seconds: int = Field(default=15)            # per-tool call timeout
     moa_timeout_seconds: int = Field(default=30)               # per-proposer timeout when delegating
+    serp_cache_ttl_seconds: int = Field(default=86400)         # research_cache.db SERP entries older than this are refetched
 
     # ---------------- Judge / SMoA-MoA controls ----------------
     use_judge: bool = True
@@ -93,7 +112,41 @@ class Configuration(BaseModel):
 
         Also coerces ints/bools/floats, parses SearchAPI, and sets safe fallbacks
         for judge + LLM selections.
+
+        Results are memoized on (configurable, relevant env values), so repeated
+        calls with the same inputs return the same (read-only) instance.
         """
+        # 2) Overlay ENV (uppercase field names); only look at vars that are set
+        env_overlay: Dict[str, Any] = {
+            _UPPER_FIELDS[k]: os.environ[k] for k in _UPPER_FIELDS.keys() & os.environ.keys()
+        }
+
+        # 3) Overlay run-time config.configurable (non-field keys such as
+        #    agent_name or LangGraph internals are ignored by the model anyway)
+        cfg_overlay = {
+            k: v for k, v in ((config or {}).get("configurable", {}) or {}).items()
+            if k in cls.model_fields
+        }
+
+        try:
+            key = (cls, _freeze(cfg_overlay), tuple(sorted(env_overlay.items())))
+            hash(key)
+        except TypeError:
+            # unhashable override values: build without caching
+            return cls._build(env_overlay, cfg_overlay)
+
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None:
+            _CONFIG_CACHE.move_to_end(key)
+            return cached
+        built = cls._build(env_overlay, cfg_overlay)
+        _CONFIG_CACHE[key] = built
+        if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+            _CONFIG_CACHE.popitem(last=False)
+        return built
+
+    @classmethod
+    def _build(cls, env_overlay: Dict[str, Any], cfg_overlay: Dict[str, Any]) -> "Configuration":
         # Helpers
         def _coerce_bool(v: Any) -> Any:
             if isinstance(v, bool):
@@ -127,16 +180,6 @@ class Configuration(BaseModel):
         # 1) Start from class defaults
         base = cls()
 
-        # 2) Overlay ENV (uppercase field names)
-        env_overlay: Dict[str, Any] = {}
-        for name in cls.model_fields.keys():
-            env_val = os.environ.get(name.upper())
-            if env_val is not None:
-                env_overlay[name] = env_val
-
-        # 3) Overlay run-time config.configurable
-        cfg_overlay = (config or {}).get("configurable", {})
-
         merged = {**base.model_dump(), **env_overlay, **cfg_overlay}
 
         # 4) Coerce known numeric fields (ints)
@@ -150,8 +193,10 @@ class Configuration(BaseModel):
             "max_total_serp_calls",
             "max_pages_per_engine",
             "page_size_per_engine",
+            "search_concurrency",
             "search_timeout_seconds",
             "moa_timeout_seconds",
+            "serp_cache_ttl_seconds",
             "self_consistency_runs",
         ]:
             if k in merged:
@@ -205,3 +250,7 @@ class Configuration(BaseModel):
 
     class Config:
         arbitrary_types_allowed = True
+
+
+# ENV var name -> field name, for the env overlay in from_runnable_config
+_UPPER_FIELDS: Dict[str, str] = {f.upper(): f for f in Configuration.model_fields}
@@ -2,13 +2,54 @@
 import sqlite3
 import json
 import logging
+import threading
+import time
+from collections import OrderedDict
 
 DATABASE_FILE = "research_cache.db"
 logger = logging.getLogger(__name__)
 
+# One persistent connection per thread instead of connect/close per lookup
+_local = threading.local()
+
+# In-process LRU in front of sqlite: hot (tool_name, args_json) keys skip disk.
+# Values carry the row's write time (epoch seconds) so the TTL applies here too.
+_HOT_MAX = 512
+_HOT: "OrderedDict[tuple[str, str], tuple[str, float]]" = OrderedDict()
+_hot_lock = threading.Lock()
+
+def _hot_get(key: tuple[str, str], max_age: float | None = None) -> str | None:
+    with _hot_lock:
+        hit = _HOT.get(key)
+        if hit is None:
+            return None
+        val, written_at = hit
+        if max_age is not None and time.time() - written_at >= max_age:
+            del _HOT[key]
+            return None
+        _HOT.move_to_end(key)
+        return val
+
+def _hot_put(key: tuple[str, str], val: str, written_at: float | None = None) -> None:
+    with _hot_lock:
+        _HOT[key] = (val, time.time() if written_at is None else written_at)
+        _HOT.move_to_end(key)
+        if len(_HOT) > _HOT_MAX:
+            _HOT.popitem(last=False)
+
+def _conn() -> sqlite3.Connection:
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DATABASE_FILE, check_same_thread=False)
+        # WAL lets check_cache read while another thread is writing
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        _local.conn = conn
+    return conn
+
 def setup_database():
     """Creates the database and the cache table if they don't exist."""
-    conn = sqlite3.connect(DATABASE_FILE)
+    conn = _conn()
     cursor = conn.cursor()
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS cache (
@@ -20,24 +61,49 @@ def setup_database():
             UNIQUE(tool_name, tool_args_json)
         )
     """)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_cache_lookup ON cache(tool_name, tool_args_json)"
+    )
     conn.commit()
-    conn.close()
     logger.info("Database setup complete.")
 
-def check_cache(tool_name: str, tool_args: dict) -> str | None:
-    """Checks if a result for a given tool and arguments exists in the cache."""
+def cache_key(tool_args: dict) -> str:
+    """Canonical JSON for tool_args. Compute once and pass to check_cache/add_to_cache."""
+    # Keep stdlib default separators: existing rows in research_cache.db use this exact form.
+    return json.dumps(tool_args, sort_keys=True)
+
+def check_cache(
+    tool_name: str,
+    tool_args: dict,
+    args_json: str | None = None,
+    max_age_seconds: int | None = None,
+) -> str | None:
+    """
+    Checks if a result for a given tool and arguments exists in the cache.
+    With max_age_seconds, entries written longer ago than that count as a miss.
+    """
     try:
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
-        args_json = json.dumps(tool_args, sort_keys=True)
-        cursor.execute(
-            "SELECT result_note FROM cache WHERE tool_name = ? AND tool_args_json = ?",
-            (tool_name, args_json)
+        if args_json is None:
+            args_json = cache_key(tool_args)
+        key = (tool_name, args_json)
+        hot = _hot_get(key, max_age_seconds)
+        if hot is not None:
+            logger.info(f"✅ Cache HIT (memory) for tool '{tool_name}'")
+            return hot
+        cursor = _conn().cursor()
+        sql = (
+            "SELECT result_note, CAST(strftime('%s', timestamp) AS REAL) FROM cache "
+            "WHERE tool_name = ? AND tool_args_json = ?"
         )
+        params: tuple = key
+        if max_age_seconds is not None:
+            sql += " AND timestamp >= datetime('now', ?)"
+            params = key + (f"-{int(max_age_seconds)} seconds",)
+        cursor.execute(sql, params)
         result = cursor.fetchone()
-        conn.close()
         if result:
             logger.info(f"✅ Cache HIT for tool '{tool_name}'")
+            _hot_put(key, result[0], result[1])
             return result[0]
         return None
     except sqlite3.Error as e:
@@ -45,20 +111,22 @@ def check_cache(tool_name: str, tool_args: dict) -> str | None:
         return None
 
 
-def add_to_cache(tool_name: str, tool_args: dict, result_note: str):
-    """Adds a new result to the cache."""
+def add_to_cache(tool_name: str, tool_args: dict, result_note: str, args_json: str | None = None):
+    """Adds a result to the cache, replacing (and re-timestamping) an existing/expired entry."""
     try:
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
-        args_json = json.dumps(tool_args, sort_keys=True)
-        cursor.execute(
-            "INSERT INTO cache (tool_name, tool_args_json, result_note) VALUES (?, ?, ?)",
+        conn = _conn()
+        if args_json is None:
+            args_json = cache_key(tool_args)
+        conn.execute(
+            "INSERT INTO cache (tool_name, tool_args_json, result_note) VALUES (?, ?, ?) "
+            "ON CONFLICT(tool_name, tool_args_json) DO UPDATE SET "
+            "result_note = excluded.result_note, timestamp = CURRENT_TIMESTAMP",
             (tool_name, args_json, result_note)
         )
         conn.commit()
-        conn.close()
+        _hot_put((tool_name, args_json), result_note)
         logger.info(f"📝 Cache MISS. Added result for tool '{tool_name}' to cache.")
-    except sqlite3.IntegrityError:
-        logger.warning(f"Cache entry for {tool_name} with args {tool_args} already exists.")
     except sqlite3.Error as e:
+        # release the implicit transaction so the persistent connection stays clean
+        _conn().rollback()
         logger.error(f"Database error in add_to_cache: {e}")
\ No newline at end of file
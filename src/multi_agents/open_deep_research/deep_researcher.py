@@ -1,13 +1,18 @@
 # Drop-in replacement. Early HITL after image tools; normalized image outputs.
 import asyncio
+import hashlib
+import heapq
+import itertools
+from collections import OrderedDict, deque
 import os
 import operator
 import logging
 from datetime import datetime
-from typing import Annotated, Any, Dict, List, Optional, Union, cast
+from typing import Annotated, Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union, cast
 import re
+from functools import lru_cache
 from dotenv import load_dotenv
-from pydantic import BaseModel, SecretStr
+from pydantic import BaseModel
 from typing_extensions import TypedDict
 import json
 from ..common.judge import adjudicate_conflicts , judge_candidates
@@ -20,11 +25,14 @@ from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool, BaseTool
 from langgraph.graph import END, StateGraph
 # --- Candidate extraction from SerpApi web search outputs (stdlib only) ---
-from urllib.parse import urlparse
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunsplit
 
 from ..constants.constants import Constants
+from ..common.llm_clients import get_async_chat_model
 from ..tools import search_tools
 from .configuration import Configuration
+from .llm_cache import get_or_compute, get_or_compute_semantic, prompt_key
+from .database import setup_database, cache_key, check_cache, add_to_cache
 from multi_agents.Prompts.open_deep_research_prompts import (
     lead_researcher_prompt, research_system_prompt,
     transform_messages_into_research_topic_prompt, summarize_tool_output_prompt,
@@ -39,6 +47,21 @@ warnings.filterwarnings(
     category=UserWarning
 )
 
+# orjson (optional) parses large SerpApi payloads several times faster than stdlib json.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing handlers still apply.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, default=str)
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 load_dotenv()
@@ -61,6 +84,8 @@ MAX_TOTAL_SERP_CALLS = 15     # overall search budget
 MAX_TOOL_CALLS_PER_TURN = 6
 MAX_RESEARCHER_ITERATIONS = 20
 SEARCH_TIMEOUT_SECONDS = 30    # per call
+TOP_K_CANDIDATES = 25          # SERP candidates kept per turn after ranking
+MIN_SERP_CANDIDATES = 5        # below this, let the LLM top up candidates from the raw SERP text
 
 
 
@@ -78,23 +103,71 @@ def today_str() -> str:
     return f"{datetime.now():%a %b %d, %Y}"
 
 
-def _safe_json_loads(text):
-                    try:
-                        return json.loads(text)
-                    except json.JSONDecodeError:
-                        logger.warning(f"Failed to decode JSON from LLM extractor. Raw text: '{text}'")
-                        return []
 def get_api_key_for_model(_: str, __: RunnableConfig) -> str:
     key = os.getenv("OPENROUTER_API_KEY")
     if not key:
         raise ValueError("OPENROUTER_API_KEY environment variable not set.")
     return key
 
-def safe_format(template: str, **kwargs) -> str:
+def _chat_model(model: str, temperature: float, max_tokens: Optional[int], config: RunnableConfig) -> ChatOpenAI:
+    """Shared, pooled ChatOpenAI for this event loop (see common.llm_clients)."""
+    return get_async_chat_model(
+        model,
+        temperature,
+        max_tokens,
+        api_key=get_api_key_for_model(model, config),
+        base_url=os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"),
+    )
+
+@lru_cache(maxsize=128)
+def _prepare_template(template: str, keys: Tuple[str, ...]) -> str:
     esc = template.replace("{", "{{").replace("}", "}}")
-    for k in kwargs.keys():
+    for k in keys:
         esc = esc.replace("{{" + k + "}}", "{" + k + "}")
-    return esc.format(**kwargs)
+    return esc
+
+def safe_format(template: str, **kwargs) -> str:
+    # templates are static prompt constants; escape once, format per call
+    return _prepare_template(template, tuple(sorted(kwargs))).format(**kwargs)
+
+@lru_cache(maxsize=1)
+def _token_encoder() -> Optional[Any]:
+    # tiktoken comes with langchain-openai; fall back to a chars/4 estimate if it
+    # is missing or its BPE file can't be loaded (offline)
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+# Token counts of planner-window messages, keyed by a 16-byte digest rather than the
+# (up to ~20k char) texts themselves, so old notes aren't pinned in memory.
+_TOK_LEN_MAX = 4096
+_TOK_LEN_CACHE: "OrderedDict[bytes, int]" = OrderedDict()
+
+def _tok_len(text: str) -> int:
+    key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    n = _TOK_LEN_CACHE.get(key)
+    if n is None:
+        enc = _token_encoder()
+        n = len(enc.encode(text, disallowed_special=())) if enc else len(text) // 4
+        _TOK_LEN_CACHE[key] = n
+        if len(_TOK_LEN_CACHE) > _TOK_LEN_MAX:
+            _TOK_LEN_CACHE.popitem(last=False)
+    else:
+        _TOK_LEN_CACHE.move_to_end(key)
+    return n
+
+def _clip_tokens(text: str, max_tokens: int) -> str:
+    enc = _token_encoder()
+    if enc is None:
+        return text[:max_tokens * 4]
+    return enc.decode(enc.encode(text, disallowed_special=())[:max_tokens])
+
+def _tool_msg(content: str, name: str, tool_call_id: str) -> ToolMessage:
+    """ToolMessage for text supervisor_tools builds itself; already plain str, so skip pydantic validation."""
+    # without validation a None id would slip through; use the usual auto_<name>_0 placeholder
+    return ToolMessage.model_construct(content=content, name=name, tool_call_id=tool_call_id or f"auto_{name}_0")
 
 def _shorten(text: str, limit: int = 10000) -> str:
     if not isinstance(text, str):
@@ -105,6 +178,9 @@ def _shorten(text: str, limit: int = 10000) -> str:
     return head + f"\n...[truncated {len(text)-limit} chars]..."
 
 
+# Airbnb profile-photo URLs carry an im_w=<width> query param
+_IMAGE_URL_RE = re.compile(r"https?://\S+im_w=\d+")
+_URL_RE = re.compile(r'https?://[^\s,"\')<>]+')
 _EMAIL_RE = re.compile(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", re.IGNORECASE)
 
 _SOCIAL_HOSTS = (
@@ -112,29 +188,57 @@ _SOCIAL_HOSTS = (
     "instagram.com", "tiktok.com", "x.com", "twitter.com",
     "linkedin.com", "lnkd.in", "youtube.com", "youtu.be",
 )
+_SOCIAL_HOSTS_ALT = "|".join(re.escape(h) for h in _SOCIAL_HOSTS)
+# host.endswith(any social host) / any social host appearing in a URL, as one scan each
+_SOCIAL_HOST_SUFFIX_RE = re.compile(r"(?:" + _SOCIAL_HOSTS_ALT + r")$")
+_SOCIAL_HOST_ANY_RE = re.compile(_SOCIAL_HOSTS_ALT)
 
-def _extract_emails(text: str) -> List[str]:
-    return sorted(set(_EMAIL_RE.findall(text or "")))
+# Common SERP title separators: " | ", " – ", " — ", " · ", " :: "
+_SEP_RE = re.compile(r" (?:\||–|—|·|::) ")
 
+# SERP engines repeat the same snippets/URLs/titles; memoize the pure helpers
+@lru_cache(maxsize=4096)
+def _extract_emails(text: str) -> Tuple[str, ...]:
+    return tuple(sorted(set(_EMAIL_RE.findall(text or ""))))
+
+@lru_cache(maxsize=4096)
 def _social_from_url(u: str) -> Optional[str]:
     try:
         host = urlparse(u).netloc.lower()
     except Exception:
         return None
-    if any(host.endswith(h) for h in _SOCIAL_HOSTS):
+    if _SOCIAL_HOST_SUFFIX_RE.search(host):
         return u
     return None
 
+@lru_cache(maxsize=4096)
 def _clean_title(t: str) -> str:
     t = (t or "").strip()
-    # Common SERP separators
-    for sep in [" | ", " – ", " — ", " · ", " :: "]:
-        if sep in t:
-            left = t.split(sep, 1)[0].strip()
-            if 2 <= len(left) <= 120:
-                return left
+    for m in _SEP_RE.finditer(t):
+        left = t[:m.start()].strip()
+        if 2 <= len(left) <= 120:
+            return left
     return t[:120]
 
+def _notes_have_urls(notes: Iterable[str]) -> bool:
+    # the early-stop guard only needs to know whether any URL exists; stop at the first
+    return any(_URL_RE.search(n) for n in notes or ())
+
+@lru_cache(maxsize=4096)
+def _norm_url(u: str) -> str:
+    """Dedup key for a URL: no fragment, no trailing slash, sorted query, lowercased (as the old key was)."""
+    u = (u or "").strip()
+    if not u:
+        return ""
+    try:
+        parts = urlsplit(u)
+    except ValueError:
+        return u.lower()
+    if not parts.netloc:
+        return u.lower()
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip("/"), query, "")).lower()
+
 
 
 
@@ -185,83 +289,100 @@ def _candidate_from_item(item: Dict[str, Any]) -> Optional[Dict[str, str]]:
         "why": why,
     }
 
+def _compact_serp_text(rr: Any, limit: int = 4000) -> str:
+    """
+    "title | link | snippet" lines from a SERP payload, built until `limit` chars,
+    instead of str()-ing the whole (often huge) dict and slicing it afterwards.
+    """
+    if isinstance(rr, list):
+        items: Iterable[Any] = rr
+    elif isinstance(rr, dict):
+        if rr.get("error"):
+            return f"error: {rr['error']}"[:limit]
+        kg = rr.get("knowledge_graph")
+        items = itertools.chain(
+            rr.get("organic_results") or [],
+            [kg] if isinstance(kg, dict) else (kg or []),
+            rr.get("top_stories") or [],
+            rr.get("news_results") or [],
+            rr.get("results") or [],
+        )
+    else:
+        return str(rr)[:limit]
+
+    lines: List[str] = []
+    remaining = limit
+    for it in items:
+        if remaining <= 0:
+            break
+        if not isinstance(it, dict):
+            continue
+        fields = (it.get("title"), it.get("link") or it.get("url"), it.get("snippet") or it.get("description"))
+        line = " | ".join(str(f) for f in fields if f)[:remaining]
+        if line:
+            lines.append(line)
+            remaining -= len(line) + 1
+    return "\n".join(lines)
+
+
 def extract_candidates_from_serp_outputs(results: List[Any]) -> List[Dict[str, str]]:
     """
     results: list of raw tool outputs returned by google_search/bing_search/duckduckgo_search tools.
     Each element may be a dict with SerpApi-like shape or an error string/dict.
 
-    Returns a de-duplicated list of {name,url,why}.
+    Returns a de-duplicated list of {name,url,why}, best TOP_K_CANDIDATES first.
     """
-    seen = set()
-    out: List[Dict[str, str]] = []
+    # Light heuristic: prefer profile-like titles first
+    def _score(c: Dict[str, str]) -> int:
+        n = c["name"].lower()
+        score = 0
+        if _SOCIAL_HOST_ANY_RE.search(c["url"].lower()):
+            score += 3
+        if any(k in n for k in ("profile", "guide", "about", "abdel")):
+            score += 1
+        return -score  # ascending -> highest score first
 
-    for r in results:
-          #  accept plain lists returned by search tools
+    out: Dict[str, Dict[str, str]] = {}  # url -> candidate, first one wins (insertion-ordered)
+    scores: Dict[str, int] = {}          # url -> _score, computed once at insertion
 
-        # --- Skip news containers entirely ---
-        if isinstance(r, dict):
+    for r in results:
+        #  accept plain lists returned by search tools
+        if isinstance(r, list):
+            items: Iterable[Any] = r
+        elif isinstance(r, dict):
+            # --- Skip news containers entirely ---
             eng = (r.get("engine") or "").lower()
             if eng == "google_news" or "news_results" in r:
                 continue  # do not turn news into candidates
 
-
-        if isinstance(r, list):
-            for item in r:
-                cand = _candidate_from_item(item)
-                if cand and cand["url"] not in seen:
-                    seen.add(cand["url"])
-                    out.append(cand)
-            continue
-        if not isinstance(r, dict):
+            # Knowledge panels / Top stories can also include useful links
+            kg = r.get("knowledge_graph")
+            if isinstance(kg, dict):
+                kg_iter = [kg]
+            elif isinstance(kg, list):
+                kg_iter = kg
+            else:
+                kg_iter = []
+            # Google style "organic_results", then KG / top stories; DuckDuckGo or
+            # other shapes might place results under "results"
+            items = itertools.chain(
+                r.get("organic_results") or [],
+                kg_iter,
+                r.get("top_stories") or [],
+                r.get("results") or [],
+            )
+        else:
             # ignore non-dicts (timeouts text, etc.)
             continue
 
-        # Google style: "organic_results"
-        for item in (r.get("organic_results") or []):
-            cand = _candidate_from_item(item)
-            if cand and cand["url"] not in seen:
-                seen.add(cand["url"])
-                out.append(cand)
-
-        # Knowledge panels / Top stories can also include useful links
-        kg = r.get("knowledge_graph")
-        if isinstance(kg, dict):
-            kg_iter = [kg]
-        elif isinstance(kg, list):
-            kg_iter = kg
-        else:
-            kg_iter = []
-        for kp in kg_iter:
-            cand = _candidate_from_item(kp)
-            if cand and cand["url"] not in seen:
-                seen.add(cand["url"])
-                out.append(cand)
-
-        for ts in (r.get("top_stories") or []):
-            cand = _candidate_from_item(ts)
-            if cand and cand["url"] not in seen:
-                seen.add(cand["url"])
-                out.append(cand)
-
-        # DuckDuckGo or other shapes might place results under "results"
-        for item in (r.get("results") or []):
+        for item in items:
             cand = _candidate_from_item(item)
-            if cand and cand["url"] not in seen:
-                seen.add(cand["url"])
-                out.append(cand)
+            if cand and cand["url"] not in out:
+                out[cand["url"]] = cand
+                scores[cand["url"]] = _score(cand)
 
-    # Light heuristic: prefer profile-like titles first
-    def _score(c: Dict[str, str]) -> int:
-        n = c["name"].lower()
-        u = c["url"].lower()
-        score = 0
-        if any(host in u for host in _SOCIAL_HOSTS):
-            score += 3
-        if any(k in n for k in ["profile", "guide", "about", "abdel"]):
-            score += 1
-        return -score  # sort ascending -> highest score first
-    out.sort(key=_score)
-    return out
+    # only the best few reach the judge/HITL; same order as a stable full sort
+    return heapq.nsmallest(TOP_K_CANDIDATES, out.values(), key=lambda c: scores[c["url"]])
 
 
 
@@ -294,6 +415,14 @@ class Candidate(TypedDict, total=False):
     url: str
     why: str
 
+def _union_urls(current: Optional[FrozenSet[str]], new: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """Reducer for rejected_urls: keep a frozenset so membership checks stay O(1) across turns."""
+    cur = current if isinstance(current, frozenset) else frozenset(current or ())
+    if not new:
+        return cur
+    return cur | frozenset(new)
+
+
 class DeepResearchState(TypedDict):
     messages: List[BaseMessage]
     research_brief: Optional[str]
@@ -305,7 +434,7 @@ class DeepResearchState(TypedDict):
     candidates: Annotated[List[Candidate], operator.add]
     awaiting_disambiguation: bool
     selected_candidate: Optional[Candidate]
-    rejected_urls: Annotated[List[str], operator.add]
+    rejected_urls: Annotated[FrozenSet[str], _union_urls]
     image_probe_done: bool
 
 
@@ -317,6 +446,18 @@ class PlannerTurnOutput(BaseModel):
     reflection: str
     tool_calls: List[Dict[str, Any]]
 
+class ExtractedCandidate(BaseModel):
+    name: str = ""
+    url: str = ""
+    why: str = ""
+
+class CandidateExtractAndJudge(BaseModel):
+    """One-shot top-up extraction + ranking over the SERP candidate list."""
+    candidates: List[ExtractedCandidate] = []   # extra candidates, numbered after the listed ones
+    ranking: List[int] = []                     # indices over listed + extra, best first
+    winner_index: Optional[int] = None
+    confidence: float = 0.0
+
 
 @tool(description="Pause and reflect on findings; plan next steps.")
 def think_tool(reflection: str) -> str:
@@ -324,41 +465,97 @@ def think_tool(reflection: str) -> str:
     return f"Reflection recorded: {reflection}"
 
 
+@tool(description="Mark the investigation complete.")
+def research_complete() -> str:
+    return "Research is complete!"
+
+@tool(description="Delegate a focused research topic to a proposer team (parallel workers).")
+def conduct_research(research_topic: str) -> str:
+    logger.info("conduct_research topic: %s", research_topic)
+    return f"Delegated: {research_topic}"
+
+
+# Tool registries are static; build them once instead of on every node call
+_BASE_TOOLS: Tuple[BaseTool, ...] = (
+    think_tool,
+    search_tools.web_scraper,
+    search_tools.google_search,
+    search_tools.bing_search,
+    search_tools.duckduckgo_search,
+    search_tools.yahoo_search,
+    search_tools.yandex_search,
+    search_tools.baidu_search,
+    search_tools.google_image_search,
+    search_tools.bing_images_search,
+    search_tools.google_lens_search,
+    search_tools.google_reverse_image_search,
+    search_tools.google_maps_search,
+    search_tools.google_hotels_search,
+    search_tools.google_news_search,
+    search_tools.youtube_search,
+    search_tools.yelp_search,
+    compare_profile_pictures_tool,
+    # advanced_search_and_retrieve is *not* exposed until a candidate is chosen (see supervisor)
+)
+_SUPERVISOR_TOOLS: Tuple[BaseTool, ...] = _BASE_TOOLS + (research_complete, conduct_research)
+_BASE_TOOL_MAP: Dict[str, BaseTool] = {t.name: t for t in _BASE_TOOLS}
+_SUPERVISOR_TOOL_MAP: Dict[str, BaseTool] = {t.name: t for t in _SUPERVISOR_TOOLS}
+
+
+def _is_supervisor(config: RunnableConfig) -> bool:
+    return "supervisor" in ((config.get("configurable", {}) or {}).get("agent_name", "") or "")
+
+
 async def get_all_tools(config: RunnableConfig) -> List[BaseTool]:
-    base: List[BaseTool] = [
-        think_tool,
-        search_tools.web_scraper,
-        search_tools.google_search,
-        search_tools.bing_search,
-        search_tools.duckduckgo_search,
-        search_tools.yahoo_search,
-        search_tools.yandex_search,
-        search_tools.baidu_search,
-        search_tools.google_image_search,
-        search_tools.bing_images_search,
-        search_tools.google_lens_search,
-        search_tools.google_reverse_image_search,
-        search_tools.google_maps_search,
-        search_tools.google_hotels_search,
-        search_tools.google_news_search,
-        search_tools.youtube_search,
-        search_tools.yelp_search,
-        compare_profile_pictures_tool,
-        # advanced_search_and_retrieve is *not* exposed until a candidate is chosen (see supervisor)
-    ]
-    agent_name = (config.get("configurable", {}) or {}).get("agent_name", "")
-    if "supervisor" in agent_name:
-        @tool(description="Mark the investigation complete.")
-        def research_complete() -> str:
-            return "Research is complete!"
-
-        @tool(description="Delegate a focused research topic to a proposer team (parallel workers).")
-        def conduct_research(research_topic: str) -> str:
-            logger.info("conduct_research topic: %s", research_topic)
-            return f"Delegated: {research_topic}"
-
-        base.extend([research_complete, conduct_research])
-    return base
+    return list(_SUPERVISOR_TOOLS if _is_supervisor(config) else _BASE_TOOLS)
+
+
+def get_tool_map(config: RunnableConfig) -> Dict[str, BaseTool]:
+    """name -> tool for the config's role. Shared module dict; do not mutate."""
+    return _SUPERVISOR_TOOL_MAP if _is_supervisor(config) else _BASE_TOOL_MAP
+
+
+SERP_TOOL_NAMES = frozenset({
+    "google_search","bing_search","duckduckgo_search","yahoo_search","yandex_search","baidu_search",
+    "google_image_search","bing_images_search","google_lens_search","google_reverse_image_search",
+    "google_maps_search","google_hotels_search","google_news_search","youtube_search","yelp_search",
+})
+
+_serp_cache_ready = False
+
+def _ensure_serp_cache() -> bool:
+    global _serp_cache_ready
+    if not _serp_cache_ready:
+        try:
+            setup_database()
+            _serp_cache_ready = True
+        except Exception as e:
+            logger.warning("SERP cache unavailable: %s", e)
+    return _serp_cache_ready
+
+
+async def invoke_tool_cached(tool_: BaseTool, args: Dict[str, Any], ttl_seconds: Optional[int] = None) -> Any:
+    """
+    tool_.ainvoke(args), with SERP tools backed by research_cache.db so re-runs of
+    the same investigation skip SerpApi. Only successful dict/list payloads are stored;
+    entries older than ttl_seconds (cfg.serp_cache_ttl_seconds) are refetched.
+    """
+    name = tool_.name
+    if name not in SERP_TOOL_NAMES or not _ensure_serp_cache():
+        return await tool_.ainvoke(args)
+    args_json = cache_key(args)
+    # sqlite lookups/commits run in a worker thread (per-thread connections in
+    # database.py) so parallel SERP calls don't queue behind disk I/O on the loop
+    hit = await asyncio.to_thread(check_cache, name, args, args_json, ttl_seconds)
+    if hit is not None:
+        try:
+            return _json_loads(hit)
+        except json.JSONDecodeError:
+            pass
+    obs = await tool_.ainvoke(args)
+    if isinstance(obs, list) or (isinstance(obs, dict) and not obs.get("error")):
+        await asyncio.to_thread(add_to_cache, name, args, _json_dumps(obs), args_json)
+    return obs
 
 
 async def researcher_agent(topic: str, config: RunnableConfig, model_name: str) -> List[str]:
@@ -366,20 +563,22 @@ async def researcher_agent(topic: str, config: RunnableConfig, model_name: str)
     tools_all = await get_all_tools(config)
     research_tools = [t for t in tools_all if t.name not in ("research_complete", "conduct_research", "think_tool")]
 
-    model = ChatOpenAI(
-        model=model_name,
-        api_key=SecretStr(get_api_key_for_model(model_name, config)),
-        base_url=os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"),
-        temperature=0.1,
-        model_kwargs={"max_tokens": RESEARCHER_MAX_TOKENS},
-    ).bind_tools(research_tools)
+    model = _chat_model(model_name, 0.1, RESEARCHER_MAX_TOKENS, config).bind_tools(research_tools)
 
     sys = research_system_prompt.format(date=today_str(), max_react_tool_calls=cfg.max_react_tool_calls)
     msgs: List[BaseMessage] = [SystemMessage(content=sys), HumanMessage(content=topic)]
     notes: List[str] = []
 
+    tool_names = [t.name for t in research_tools]
+
     for _ in range(cfg.max_react_tool_calls):
-        resp = await model.ainvoke(msgs)
+        # the same (topic, proposer) is often re-delegated across supervisor turns;
+        # identical transcripts reuse the earlier step instead of re-querying
+        snapshot = list(msgs)
+        resp = await get_or_compute(
+            prompt_key(model_name, snapshot, tool_names),
+            lambda: model.ainvoke(snapshot),
+        )
         msgs.append(resp)
         calls = getattr(resp, "tool_calls", []) or []
         if not calls:
@@ -390,7 +589,7 @@ async def researcher_agent(topic: str, config: RunnableConfig, model_name: str)
             if not tool_:
                 continue
             try:
-                obs = await tool_.ainvoke(tc.get("args", {}))
+                obs = await invoke_tool_cached(tool_, tc.get("args", {}), cfg.serp_cache_ttl_seconds)
                 notes.append(str(obs))
                 msgs.append(ToolMessage(content=str(obs), name=tname or "", tool_call_id=tc.get("id", "")))
             except Exception as e:
@@ -403,21 +602,23 @@ async def researcher_agent(topic: str, config: RunnableConfig, model_name: str)
 async def write_research_brief(state: DeepResearchState, config: RunnableConfig) -> Dict[str, Any]:
     text = get_buffer_string(state["messages"])
     image_url = None
-    m = re.search(r"(https?://[^\s]+(?:im_w=\d+))", text)
+    m = _IMAGE_URL_RE.search(text) if "im_w=" in text else None
     if m:
         image_url = m.group(0)
 
     cfg = Configuration.from_runnable_config(config)
-    model = ChatOpenAI(
-        model=cfg.planner_model,
-        api_key=SecretStr(get_api_key_for_model(cfg.planner_model, config)),
-        base_url=os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"),
-        temperature=0.1,
-        model_kwargs={"max_tokens": 4096},
-    )
+    model = _chat_model(cfg.planner_model, 0.1, 4096, config)
     model_struct = cast(Any, model).with_structured_output(ResearchQuestion)
     prompt = safe_format(transform_messages_into_research_topic_prompt, messages=text, date=today_str())
-    rq = cast(ResearchQuestion, await model_struct.ainvoke([HumanMessage(content=prompt)]))
+    brief_msgs: List[BaseMessage] = [HumanMessage(content=prompt)]
+    # the brief depends only on the user's conversation, so near-identical
+    # rephrasings (same model, same day) may reuse an earlier brief
+    rq = cast(ResearchQuestion, await get_or_compute_semantic(
+        prompt_key(cfg.planner_model, brief_msgs),
+        f"research_brief:{cfg.planner_model}:{today_str()}",
+        text,
+        lambda: model_struct.ainvoke(brief_msgs),
+    ))
 
     sys = safe_format(lead_researcher_prompt, date=today_str())
     return {
@@ -430,7 +631,7 @@ async def write_research_brief(state: DeepResearchState, config: RunnableConfig)
         "candidates": [],
         "awaiting_disambiguation": False,
         "selected_candidate": None,
-        "rejected_urls": [],  
+        "rejected_urls": frozenset(),  
     }
 
 
@@ -439,45 +640,47 @@ async def supervisor(state: DeepResearchState, config: RunnableConfig) -> Dict[s
     sup_cfg: RunnableConfig = {"configurable": {**(config.get("configurable", {}) or {}), "agent_name": "supervisor"}}
     tools = await get_all_tools(sup_cfg)
 
-    model = ChatOpenAI(
-        model=cfg.planner_model,
-        api_key=SecretStr(get_api_key_for_model(cfg.planner_model, config)),
-        base_url=os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"),
-        temperature=0.1,
-        model_kwargs={"max_tokens": PLANNER_MAX_TOKENS},
-    ).bind_tools(tools)
+    model = _chat_model(cfg.planner_model, 0.1, PLANNER_MAX_TOKENS, config).bind_tools(tools)
     
 
     # Ask the planner to be terse to avoid JSON truncation
     model_struct = cast(Any, model).with_structured_output(PlannerTurnOutput)
     
 
-    def _clip_toolmsgs(msgs, per_msg_limit=3000, total_limit=20000):
-        total = 0
+    # Budgets are in tokens (≈ the old 3000 / 20000 char caps); counts are cached per text
+    def _clip_toolmsgs(msgs, per_msg_tokens=750, total_tokens=5000):
         clipped = []
         for m in msgs:
             if isinstance(m, ToolMessage):
                 text = getattr(m, "content", "")
-                if len(text) > per_msg_limit:
-                    text = text[:per_msg_limit] + f"… [truncated {len(text)-per_msg_limit} chars]"
-                total += len(text)
+                if not isinstance(text, str):
+                    text = str(text)
+                n_tok = _tok_len(text)
+                if n_tok > per_msg_tokens:
+                    text = _clip_tokens(text, per_msg_tokens) + f"… [truncated {n_tok-per_msg_tokens} tokens]"
                 clipped.append(
                     ToolMessage(content=text, name=m.name, tool_call_id=getattr(m, "tool_call_id", ""))
                 )
             else:
                 clipped.append(m)
-        # safety: enforce total cap
-        while len(get_buffer_string(clipped)) > total_limit and len(clipped) > 3:
-            clipped.pop(0)
-        return clipped
-
-    pruned_msgs = _clip_toolmsgs(state["planner_messages"])
+        # safety: enforce total cap. Measure each message once and pop from the
+        # front against a running total.
+        sizes = deque(_tok_len(get_buffer_string([m])) for m in clipped)
+        running = sum(sizes)
+        clipped = deque(clipped)
+        while running > total_tokens and len(clipped) > 3:
+            running -= sizes.popleft()
+            clipped.popleft()
+        return list(clipped)
 
     # Prepend a terse SystemMessage just for this turn
     pruned_msgs = _clip_toolmsgs(state["planner_messages"])
     planner_input = pruned_msgs if RICH_MODE else [SystemMessage(content="Be concise. ")] + pruned_msgs
     try:
-        out: PlannerTurnOutput = await model_struct.ainvoke(planner_input)
+        out: PlannerTurnOutput = await get_or_compute(
+            prompt_key(cfg.planner_model, planner_input),
+            lambda: model_struct.ainvoke(planner_input),
+        )
     except Exception as e:
         # If JSON parsing failed due to length, retry with even smaller window + explicit brevity
         if "LengthFinishReasonError" in str(e) or "length limit" in str(e).lower():
@@ -550,23 +753,18 @@ async def supervisor_tools(state: DeepResearchState, config: RunnableConfig) ->
         return {}
 
     cfg = Configuration.from_runnable_config(config)
+    brief = state.get("research_brief") or ""
+    use_judge = cfg.use_judge
+    # candidate_extraction_model is Optional; unset means "same as the aggregator"
+    extraction_model = cfg.candidate_extraction_model or cfg.aggregator_model
 
-    agg = ChatOpenAI(
-        model=getattr(cfg, "aggregator_model", Constants.AGGREGATOR_MODEL),
-        api_key=SecretStr(get_api_key_for_model(getattr(cfg, "aggregator_model", Constants.AGGREGATOR_MODEL), config)),
-        base_url=os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"),
-        temperature=0.0,
-        model_kwargs={"max_tokens": AGGREGATOR_MAX_TOKENS},
-    )
+    agg = _chat_model(cfg.aggregator_model, 0.0, AGGREGATOR_MAX_TOKENS, config)
 
     all_notes: List[str] = []
     tool_msgs: List[ToolMessage] = []
+    tool_map = get_tool_map(config)
 
-    serpish = {
-        "google_search","bing_search","duckduckgo_search","yahoo_search","yandex_search","baidu_search",
-        "google_image_search","bing_images_search","google_lens_search","google_reverse_image_search",
-        "google_maps_search","google_hotels_search","google_news_search","youtube_search","yelp_search",
-    }
+    serpish = SERP_TOOL_NAMES
     used = state.get("serp_calls_used", 0)
     max_serp = max(0, getattr(cfg, "max_total_serp_calls", MAX_TOTAL_SERP_CALLS))
 
@@ -605,16 +803,39 @@ async def supervisor_tools(state: DeepResearchState, config: RunnableConfig) ->
 
 
     
-    rejected = set(state.get("rejected_urls") or [])
+    # normalized once, so trailing slashes / fragments / query order don't slip past it
+    rejected = frozenset(_norm_url(u) for u in (state.get("rejected_urls") or ()))
     def _is_blocked(call: Dict[str, Any]) -> bool:
         if call.get("name") != "web_scraper":
             return False
         url = (call.get("args") or {}).get("url") or ""
-        return url in rejected
+        return _norm_url(str(url)) in rejected
+
+    if rejected:
+        image_calls_all    = [c for c in image_calls_all if not _is_blocked(c)]
+        nonimage_calls_all = [c for c in nonimage_calls_all if not _is_blocked(c)]
+        other_calls        = [c for c in other_calls if not _is_blocked(c)]
+
+    # Planner sometimes repeats a call within one turn; don't spend SERP budget twice on it
+    def _dedup_calls(calls_in: List[Dict[str, Any]], key_fn) -> List[Dict[str, Any]]:
+        seen_keys = set()
+        kept = []
+        for c in calls_in:
+            k = key_fn(c)
+            if k in seen_keys:
+                continue
+            seen_keys.add(k)
+            kept.append(c)
+        return kept
 
-    image_calls_all    = [c for c in image_calls_all if not _is_blocked(c)]
-    nonimage_calls_all = [c for c in nonimage_calls_all if not _is_blocked(c)]
-    other_calls        = [c for c in other_calls if not _is_blocked(c)]
+    image_calls_all = _dedup_calls(
+        image_calls_all,
+        lambda c: (c.get("name"), (c.get("args") or {}).get("image_url") or state.get("image_url")),
+    )
+    nonimage_calls_all = _dedup_calls(
+        nonimage_calls_all,
+        lambda c: (c.get("name"), cache_key(c.get("args") or {})),
+    )
 
     remaining = max(0, max_serp - used)
     reserve_for_images = 2 if (state.get("image_url") and not state.get("image_probe_done")) else 0
@@ -630,29 +851,50 @@ async def supervisor_tools(state: DeepResearchState, config: RunnableConfig) ->
 
     selected_candidate_update: Optional[Candidate] = None
 
+    # adjudicate_conflicts only needs note_text; start it as soon as note_text is
+    # set so it overlaps the extractor / judge / other tools instead of trailing them
+    arb_task: Optional[asyncio.Task[Dict[str, Any]]] = None
+    def _start_arbitration(text: str) -> Optional[asyncio.Task[Dict[str, Any]]]:
+        if not text or not use_judge:
+            return None
+        return asyncio.create_task(adjudicate_conflicts(
+            research_brief=brief,
+            agent_findings={"direct_search_summary": text},
+            config=config,
+        ))
+
     # ---------- helper: dedup with permissive input typing ----------
-    def _dedup(lst: List[Dict[str, Any]]) -> List[Candidate]:
-        seen = set()
-        out: List[Candidate] = []
+    def _cand_key(c: Dict[str, Any]) -> str:
+        return _norm_url(str(c.get("url") or "")) or (str(c.get("name") or "")).strip().lower()
+
+    def _extend_unique(out: List[Candidate], seen: set, lst: Iterable[Dict[str, Any]]) -> List[Candidate]:
+        # appends in place against a running key set, so merges never rebuild the list
         for c in lst:
-            u = (str(c.get("url") or "")).strip().lower()
-            n = (str(c.get("name") or "")).strip().lower()
-            key = u or n
+            key = _cand_key(c)
             if not key or key in seen:
                 continue
             seen.add(key)
             out.append({"name": str(c.get("name","")), "url": str(c.get("url","")), "why": str(c.get("why",""))})
         return out
+
+    # keys of new_candidates (or of combined_candidates, which becomes new_candidates)
+    cand_seen: set = set()
     # ---------------------------------------------------------------
 
     # --- Delegation (optional) ---
+    team_tasks: List["asyncio.Task[Any]"] = []
     if conduct_calls:
         proposer_models = getattr(cfg, "proposer_models", Constants.PROPOSER_MODELS)
         MOA_TIMEOUT = getattr(cfg, "moa_timeout_seconds", 30)
+        # topics x proposers can fire dozens of ReAct loops at once; cap them so
+        # OpenRouter 429 backoff doesn't end up serialising the whole team.
+        # The timeout only starts once a slot is acquired.
+        research_sem = asyncio.Semaphore(max(1, int(getattr(cfg, "max_concurrent_research_units", 5))))
 
         async def run_proposer(topic: str, model_name: str) -> List[str]:
             try:
-                return await asyncio.wait_for(researcher_agent(topic, config, model_name), timeout=MOA_TIMEOUT)
+                async with research_sem:
+                    return await asyncio.wait_for(researcher_agent(topic, config, model_name), timeout=MOA_TIMEOUT)
             except asyncio.TimeoutError:
                 return [f"⏰ Timeout after {MOA_TIMEOUT}s in proposer {model_name}"]
             except Exception as e:
@@ -663,7 +905,81 @@ async def supervisor_tools(state: DeepResearchState, config: RunnableConfig) ->
             results = await asyncio.gather(*tasks, return_exceptions=True)
             return topic, results
 
+        # Started now, collected after the image probes: proposers are the slowest
+        # leg (up to MOA_TIMEOUT) and the image tools don't depend on their output.
         team_tasks = [asyncio.create_task(team_job(c.get("args", {}).get("research_topic", ""))) for c in conduct_calls]
+
+    # SERP/image calls in this turn share one bounded pool; timeouts start once a slot is held
+    search_sem = asyncio.Semaphore(max(1, int(getattr(cfg, "search_concurrency", 4))))
+
+    try:
+        # --- IMAGE TOOLS FIRST ---
+        image_notes: List[str] = []
+        image_msgs: List[ToolMessage] = []
+        if image_calls:
+            SEARCH_TIMEOUT = getattr(cfg, "search_timeout_seconds", 15)
+
+            async def run_img_call(call):
+                name = call.get("name", "")
+                args = dict(call.get("args", {}))
+                if state.get("image_url") and "image_url" not in args:
+                    args["image_url"] = state["image_url"]
+                async with search_sem:
+                    return await asyncio.wait_for(
+                        invoke_tool_cached(tool_map[name], args, cfg.serp_cache_ttl_seconds), timeout=SEARCH_TIMEOUT
+                    )
+
+            gathered = await asyncio.gather(*(run_img_call(c) for c in image_calls), return_exceptions=True)
+            img_results: List[Any] = []
+            for c, r in zip(image_calls, gathered):
+                if isinstance(r, asyncio.TimeoutError):
+                    r = {"error": f"⏰ Timeout after {SEARCH_TIMEOUT}s in {c.get('name')}"}
+                elif isinstance(r, BaseException):
+                    r = {"error": f"❌ Error in {c.get('name')}: {r}"}
+                img_results.append(r)
+
+            image_candidates: List[Candidate] = []
+            for raw in img_results:
+                norm = _normalize_image_tool_output(raw if isinstance(raw, dict) else {})
+                matches = norm.get("matches", []) or []
+                for m in matches:
+                    title = (m.get("title") or "").strip()
+                    link  = (m.get("link") or m.get("source") or "").strip()
+                    if not (title or link):
+                        continue
+                    image_candidates.append({
+                        "name": title or "Unknown",
+                        "url": link,
+                        "why": "Visually similar match from reverse image/Lens search",
+                    })
+
+            used += len(image_calls)
+            image_probe_done = True
+
+            if image_candidates:
+                cand_lines = "\n".join(f"- {c.get('name','?')} — {c.get('url','')}" for c in image_candidates)
+                short_img = _shorten(f"Image search produced {len(image_candidates)} candidates:\n{cand_lines}", limit=1200)
+                image_notes.append(short_img)
+                image_msgs.append(_tool_msg(content=short_img, name="image_search", tool_call_id=image_calls[0].get("id", "auto_image_0")))
+                # 👇 add trace
+                from ..common.trace import trace_event
+                trace_event("image_candidates_found", {
+                    "count": len(image_candidates),
+                    "candidates": image_candidates[:5],  # cap for readability
+                })
+            else:
+                msg = "Image search returned no actionable profile matches; proceeding with name-based search."
+                image_notes.append(msg)
+                image_msgs.append(_tool_msg(content=msg, name="image_search", tool_call_id=image_calls[0].get("id", "auto_image_0")))
+    except BaseException:
+        # the proposer teams started above would otherwise keep running unowned
+        for t in team_tasks:
+            t.cancel()
+        await asyncio.gather(*team_tasks, return_exceptions=True)
+        raise
+
+    # --- Delegation results (before the image notes, as the planner has always seen them) ---
+    if conduct_calls:
         team_out = await asyncio.gather(*team_tasks, return_exceptions=True)
 
         final_note = ""
@@ -681,280 +997,350 @@ async def supervisor_tools(state: DeepResearchState, config: RunnableConfig) ->
                 final_note += f"\n--- Sub-findings from Agent {m} ---\n" + "\n".join(r)
 
         all_notes.append(final_note)
-        tool_msgs.append(ToolMessage(content=final_note, name="conduct_research_team", tool_call_id=conduct_calls[0]["id"]))
-
-    # --- IMAGE TOOLS FIRST ---
-    if image_calls:
-        tool_map = {t.name: t for t in await get_all_tools(config)}
-        SEARCH_TIMEOUT = getattr(cfg, "search_timeout_seconds", 15)
-
-        async def run_img_call(call):
-            name = call.get("name", "")
-            args = dict(call.get("args", {}))
-            if state.get("image_url") and "image_url" not in args:
-                args["image_url"] = state["image_url"]
-            return await asyncio.wait_for(tool_map[name].ainvoke(args), timeout=SEARCH_TIMEOUT)
-
-        img_results: List[Any] = []
-        for c in image_calls:
-            try:
-                r = await run_img_call(c)
-            except asyncio.TimeoutError:
-                r = {"error": f"⏰ Timeout after {SEARCH_TIMEOUT}s in {c.get('name')}"}
-            except Exception as e:
-                r = {"error": f"❌ Error in {c.get('name')}: {e}"}
-            img_results.append(r)
-
-        image_candidates: List[Candidate] = []
-        for raw in img_results:
-            norm = _normalize_image_tool_output(raw if isinstance(raw, dict) else {})
-            matches = norm.get("matches", []) or []
-            for m in matches:
-                title = (m.get("title") or "").strip()
-                link  = (m.get("link") or m.get("source") or "").strip()
-                if not (title or link):
-                    continue
-                image_candidates.append({
-                    "name": title or "Unknown",
-                    "url": link,
-                    "why": "Visually similar match from reverse image/Lens search",
-                })
-
-        used += len(image_calls)
-        image_probe_done = True
-
-        if image_candidates:
-            cand_lines = "\n".join(f"- {c.get('name','?')} — {c.get('url','')}" for c in image_candidates)
-            short_img = _shorten(f"Image search produced {len(image_candidates)} candidates:\n{cand_lines}", limit=1200)
-            all_notes.append(short_img)
-            tool_msgs.append(ToolMessage(content=short_img, name="image_search", tool_call_id=image_calls[0].get("id", "auto_image_0")))
-            # 👇 add trace
-            from ..common.trace import trace_event
-            trace_event("image_candidates_found", {
-                "count": len(image_candidates),
-                "candidates": image_candidates[:5],  # cap for readability
-            })
-        else:
-            msg = "Image search returned no actionable profile matches; proceeding with name-based search."
-            all_notes.append(msg)
-            tool_msgs.append(ToolMessage(content=msg, name="image_search", tool_call_id=image_calls[0]["id"]))
-            
-
+        tool_msgs.append(_tool_msg(content=final_note, name="conduct_research_team", tool_call_id=conduct_calls[0]["id"]))
 
-        
-
-    # --- NON-IMAGE PARALLEL SEARCHES ---
-    if nonimage_calls:
-        tool_map = {t.name: t for t in await get_all_tools(config)}
-        SEARCH_TIMEOUT = getattr(cfg, "search_timeout_seconds", 15)
+    all_notes.extend(image_notes)
+    tool_msgs.extend(image_msgs)
 
-        async def run_one(tname: str, targs: dict) -> Any:
-            try:
-                return await asyncio.wait_for(tool_map[tname].ainvoke(targs), timeout=SEARCH_TIMEOUT)
-            except asyncio.TimeoutError:
-                return {"error": f"⏰ Timeout after {SEARCH_TIMEOUT}s in {tname}"}
-            except Exception as e:
-                return {"error": f"❌ Error in {tname}: {e}"}
-
-        tasks: List[asyncio.Task[Any]] = []
-        for c in nonimage_calls:
-            name = c.get("name", "")
-            args = dict(c.get("args", {}))
-            tasks.append(asyncio.create_task(run_one(name, args)))
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    try:
+        # --- NON-IMAGE PARALLEL SEARCHES ---
+        if nonimage_calls:
+            SEARCH_TIMEOUT = getattr(cfg, "search_timeout_seconds", 15)
+
+            async def run_one(tname: str, targs: dict) -> Any:
+                try:
+                    async with search_sem:
+                        return await asyncio.wait_for(
+                            invoke_tool_cached(tool_map[tname], targs, cfg.serp_cache_ttl_seconds), timeout=SEARCH_TIMEOUT
+                        )
+                except asyncio.TimeoutError:
+                    return {"error": f"⏰ Timeout after {SEARCH_TIMEOUT}s in {tname}"}
+                except Exception as e:
+                    return {"error": f"❌ Error in {tname}: {e}"}
+
+            tasks: List[asyncio.Task[Any]] = []
+            for c in nonimage_calls:
+                name = c.get("name", "")
+                args = dict(c.get("args", {}))
+                tasks.append(asyncio.create_task(run_one(name, args)))
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        raw_results = [r for r in results if isinstance(r, dict)]
-        serp_candidates = extract_candidates_from_serp_outputs(raw_results)
-        serp_candidates = [c for c in serp_candidates if (c.get("url") or "") not in rejected]
+            # google/bing/... tools return the organic_results list itself; keep those too so
+            # their title/link/snippet become candidates directly instead of via the LLM
+            raw_results = [r for r in results if isinstance(r, (dict, list))]
+            serp_candidates = extract_candidates_from_serp_outputs(raw_results)
+            if rejected:
+                serp_candidates = [c for c in serp_candidates if _norm_url(c.get("url") or "") not in rejected]
 
-        combined_candidates: List[Candidate] = _dedup(serp_candidates)  # <-- typing fixed
+            combined_candidates: List[Candidate] = _extend_unique([], cand_seen, serp_candidates)
 
-        # Optional LLM top-up (no cap)
-        raw_text_blob = ""
-        try:
+            # Optional LLM top-up (no cap)
+            # ≤4000 chars per result, 12000 overall, spent as results are compacted
             parts: List[str] = []
+            remaining = 12000
             for rr in raw_results:
-                parts.append(str(rr)[:4000])
-            raw_text_blob = "\n\n".join(parts)[:12000]
-        except Exception:
-            raw_text_blob = ""
-
-        if raw_text_blob:
-            extraction_prompt = (
-                "From the text below, extract ALL possible candidate entities (people/companies/profiles) "
-                "that might match the brief.\nReturn STRICT JSON list of objects with fields: name, url, why.\n"
-                f"Brief:\n{state.get('research_brief')}\n\nText:\n{raw_text_blob}\n"
+                if remaining <= 0:
+                    break
+                part = _compact_serp_text(rr, min(4000, remaining))
+                if part:
+                    parts.append(part)
+                    remaining -= len(part) + 2
+            raw_text_blob = "\n\n".join(parts)
+
+            # Top-up extraction and ranking share one structured call; the full
+            # judge_candidates committee only runs if that call fails.
+            fused: Optional[CandidateExtractAndJudge] = None
+            # Extraction only pays off when the SERP parse came up short and the text links
+            # somewhere it didn't already list; otherwise send a rank-only prompt without the text, or skip
+            # the call entirely when there is nothing to rank either.
+            has_new_signal = len(combined_candidates) < MIN_SERP_CANDIDATES and bool(raw_text_blob) and any(
+                _norm_url(u) not in cand_seen for u in _URL_RE.findall(raw_text_blob)
             )
-            extractor = ChatOpenAI(
-                model=getattr(cfg, "candidate_extraction_model", getattr(cfg, "aggregator_model", Constants.AGGREGATOR_MODEL)),
-                api_key=SecretStr(get_api_key_for_model(getattr(cfg, "candidate_extraction_model", getattr(cfg, "aggregator_model", Constants.AGGREGATOR_MODEL)), config)),
-                base_url=os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"),
-                temperature=0.0,
-            )
-            try:
-                ext = await extractor.ainvoke([HumanMessage(content=extraction_prompt)])
-            
-                extracted = _safe_json_loads(raw if isinstance(raw, str) else str(raw))
-                extra_cands: List[Dict[str, Any]] = []
-                for e in extracted or []:
-                    extra_cands.append({
-                        "name": str(e.get("name","")).strip(),
-                        "url":  str(e.get("url","")).strip(),
-                        "why":  str(e.get("why","")).strip(),
-                    })
-                combined_candidates = _dedup(combined_candidates + extra_cands)  # type: ignore[arg-type]
-            except Exception as e:
-                logger.warning("LLM top-up candidate extraction failed: %s", e)
-
-        if combined_candidates:
-            cand_lines = []
-            for i, cand in enumerate(combined_candidates):
-                nm = cand.get("name") or "?"
-                url = cand.get("url") or ""
-                why = cand.get("why") or ""
-                cand_lines.append(f"[{i}] {nm} — {url}\n      why: {why}")
-            note_text = "Candidates from web search:\n" + "\n".join(cand_lines)
-            all_notes.append(note_text)
-            tool_msgs.append(ToolMessage(content=note_text, name="web_search_candidates", tool_call_id=nonimage_calls[0].get("id", "auto_nonimage_0")))
-            used += len(nonimage_calls)
-            new_candidates = combined_candidates
-            awaiting = True
-
-            # Ask the judge to rank; hint what matters (relevance for search)
-            judge_out = await judge_candidates(
-                research_brief=state.get("research_brief") or "",
-                candidates=new_candidates,
-                notes=all_notes,                 # or [note_text] if you want only the latest
-                config=config,
-                aspect_hint="relevance",         # SMoA gate to relevance-savvy models
-            )
-
-            
-            # Persist ranking + diagnostics for transparency
-            diag = judge_out.get("diagnostics") or {}
-            all_notes.append(
-                "[judge] "
-                f"ranking={judge_out.get('ranking')} "
-                f"winner_index={judge_out.get('winner_index')} "
-                f"conf={judge_out.get('confidence')} "
-                f"diag={str(diag)[:800]}"
-            )
-
-            # Bias/uncertainty guardrails — force HITL if position bias looks high
-            bias = (diag.get("bias") or {}) if isinstance(diag, dict) else {}
-            pos_bias_rate = float(bias.get("position_bias_rate", 0.0)) if isinstance(bias, dict) else 0.0
-            position_flip_alarm = float(getattr(JudgeConstants, "JUDGE_POSITION_FLIP_ALARM", 0.20))
-            bias_alarm = pos_bias_rate >= position_flip_alarm
-
-            # If confident and no bias alarm, auto-select; else pause for user disambiguation
-            if (not judge_out.get("should_pause_for_human")) and (judge_out.get("winner_index") is not None) and (not bias_alarm):
-                wi = int(judge_out["winner_index"])
-                if 0 <= wi < len(new_candidates):
-                    selected_candidate_update = new_candidates[wi]
-                    awaiting = False
-            else:
+            if has_new_signal or combined_candidates:
+                listed = "\n".join(
+                    f"[{i}] {c.get('name') or '?'} — {c.get('url') or ''}"
+                    for i, c in enumerate(combined_candidates)
+                ) or "(none)"
+                rank_instr = (
+                    "ranking = indices best first, winner_index = the best match or null if none clearly matches, "
+                    "confidence in [0,1].\n"
+                )
+                if has_new_signal:
+                    fused_prompt = (
+                        "From the text below, extract ALL additional candidate entities (people/companies/profiles) "
+                        "that might match the brief and are not already listed. Number them after the listed ones.\n"
+                        "Then rank the listed + extracted candidates by how well they match the brief: "
+                        + rank_instr +
+                        f"Brief:\n{brief}\n\nListed candidates:\n{listed}\n\nText:\n{raw_text_blob}\n"
+                    )
+                else:
+                    fused_prompt = (
+                        "Rank the listed candidates by how well they match the brief (return no extra candidates): "
+                        + rank_instr +
+                        f"Brief:\n{brief}\n\nListed candidates:\n{listed}\n"
+                    )
+                fused_model = cast(Any, _chat_model(extraction_model, 0.0, None, config)).with_structured_output(CandidateExtractAndJudge)
+                fused_msgs: List[BaseMessage] = [HumanMessage(content=fused_prompt)]
+                try:
+                    fused = cast(CandidateExtractAndJudge, await get_or_compute(
+                        prompt_key(extraction_model, fused_msgs, ("CandidateExtractAndJudge",)),
+                        lambda: fused_model.ainvoke(fused_msgs),
+                    ))
+                except Exception as e:
+                    logger.warning("Fused candidate extraction/judge failed: %s", e)
+                    fused = None
+
+            fused_winner_idx: Optional[int] = None
+            fused_ranking: List[int] = []
+            if fused is not None:
+                extra_cands: List[Dict[str, Any]] = [
+                    {"name": e.name.strip(), "url": e.url.strip(), "why": e.why.strip()}
+                    for e in fused.candidates
+                ]
+                ranked_pool: List[Dict[str, Any]] = [*combined_candidates, *extra_cands]
+                _extend_unique(combined_candidates, cand_seen, extra_cands)
+
+                # fused indices refer to ranked_pool; re-anchor them on the deduped list
+                pos = {_cand_key(c): i for i, c in enumerate(combined_candidates)}  # type: ignore[arg-type]
+                def _pool_to_idx(i: Optional[int]) -> Optional[int]:
+                    if i is None or not (0 <= i < len(ranked_pool)):
+                        return None
+                    return pos.get(_cand_key(ranked_pool[i]))
+                fused_winner_idx = _pool_to_idx(fused.winner_index)
+                fused_ranking = [j for j in dict.fromkeys(_pool_to_idx(i) for i in fused.ranking) if j is not None]
+
+            if combined_candidates:
+                cand_lines = []
+                for i, cand in enumerate(combined_candidates):
+                    nm = cand.get("name") or "?"
+                    url = cand.get("url") or ""
+                    why = cand.get("why") or ""
+                    cand_lines.append(f"[{i}] {nm} — {url}\n      why: {why}")
+                note_text = "Candidates from web search:\n" + "\n".join(cand_lines)
+                arb_task = _start_arbitration(note_text)
+                all_notes.append(note_text)
+                tool_msgs.append(_tool_msg(content=note_text, name="web_search_candidates", tool_call_id=nonimage_calls[0].get("id", "auto_nonimage_0")))
+                used += len(nonimage_calls)
+                new_candidates = combined_candidates
                 awaiting = True
 
-            # Human-readable tool message with diagnostics
-            router_diag = (diag.get("router") or {}) if isinstance(diag, dict) else {}
-            chosen_models = router_diag.get("chosen_models", [])
-            tool_msgs.append(
-                ToolMessage(
-                    content=(
-                        "LLM Judge decision:\n"
-                        f"- winner_index: {judge_out.get('winner_index')}\n"
-                        f"- confidence: {judge_out.get('confidence'):.3f}\n"
-                        f"- pause: {judge_out.get('should_pause_for_human')} (bias_alarm={bias_alarm})\n"
-                        f"- ranking (top 5): {str(judge_out.get('ranking', []))[:800]}\n"
-                        f"- router chosen models: {chosen_models}\n"
-                        f"- bias diag: {bias}"
-                    ),
-                    name="llm_judge",
-                    tool_call_id="judge_candidates"
-                )
-            )
+                if fused is not None:
+                    # The fused call already ranked this list. It is a single model's
+                    # self-reported confidence (no committee, no margin between the top two),
+                    # so it pauses on: no winner, confidence below pause_threshold, or a
+                    # winner that does not survive an order-swapped re-rank (position bias).
+                    conf = max(0.0, min(1.0, float(fused.confidence or 0.0)))
+                    should_pause = (fused_winner_idx is None) or (conf < float(cfg.pause_threshold))
+                    if fused_winner_idx is None:
+                        question = "No candidate clearly matched the brief—please pick one, or none."
+                    elif should_pause:
+                        question = f"Low confidence ({conf:.2f}) in the top candidate—please confirm or pick another."
+                    else:
+                        question = ""
+
+                    # Swap check: re-rank the same list in reverse order (rank-only, no text)
+                    # before trusting an auto-selection. Feeds diagnostics["bias"], so the
+                    # bias_alarm guard below applies to this path too; with
+                    # enable_swap_mitigation off the check (and the alarm) is skipped on purpose.
+                    bias_diag: Dict[str, Any] = {"swap_checked": False}
+                    if not should_pause and cfg.enable_swap_mitigation and len(new_candidates) > 1:
+                        n = len(new_candidates)
+                        swapped_listed = "\n".join(
+                            f"[{k}] {c.get('name') or '?'} — {c.get('url') or ''}"
+                            for k, c in enumerate(reversed(new_candidates))
+                        )
+                        swap_msgs: List[BaseMessage] = [HumanMessage(content=(
+                            "Rank the listed candidates by how well they match the brief (return no extra candidates): "
+                            + rank_instr +
+                            f"Brief:\n{brief}\n\nListed candidates:\n{swapped_listed}\n"
+                        ))]
+                        swapped_winner: Optional[int] = None
+                        try:
+                            swapped = cast(CandidateExtractAndJudge, await get_or_compute(
+                                prompt_key(extraction_model, swap_msgs, ("CandidateExtractAndJudge",)),
+                                lambda: fused_model.ainvoke(swap_msgs),
+                            ))
+                            if swapped.winner_index is not None and 0 <= swapped.winner_index < n:
+                                swapped_winner = n - 1 - swapped.winner_index
+                        except Exception as e:
+                            logger.warning("Swapped re-rank failed: %s", e)
+                        flipped = swapped_winner != fused_winner_idx
+                        bias_diag = {
+                            "swap_checked": True,
+                            "swapped_winner_index": swapped_winner,
+                            "position_bias_rate": 1.0 if flipped else 0.0,
+                        }
+                        if flipped:
+                            should_pause = True
+                            question = "The top pick changed when the candidate order was swapped—please pick the correct one."
+
+                    judge_out = {
+                        "ranking": [
+                            {"index": i, "name": new_candidates[i].get("name", ""), "reason": "fused extract+judge"}
+                            for i in fused_ranking
+                        ],
+                        "winner_index": fused_winner_idx,
+                        "confidence": conf,
+                        "should_pause_for_human": should_pause,
+                        "human_question": question,
+                        "diagnostics": {
+                            "router": {"chosen_models": [extraction_model]},
+                            "fused": True,
+                            "bias": bias_diag,
+                        },
+                    }
+                else:
+                    # Ask the judge to rank; hint what matters (relevance for search)
+                    judge_out = await judge_candidates(
+                        research_brief=brief,
+                        candidates=new_candidates,
+                        notes=all_notes,                 # or [note_text] if you want only the latest
+                        config=config,
+                        aspect_hint="relevance",         # SMoA gate to relevance-savvy models
+                    )
+
+
+                diag = judge_out.get("diagnostics") or {}
+
+                # Bias/uncertainty guardrails — force HITL if position bias looks high
+                bias = diag.get("bias") or {}
+                pos_bias_rate = float(bias.get("position_bias_rate", 0.0))
+                position_flip_alarm = float(getattr(JudgeConstants, "JUDGE_POSITION_FLIP_ALARM", 0.20))
+                bias_alarm = pos_bias_rate >= position_flip_alarm
+
+                # If confident and no bias alarm, auto-select; else pause for user disambiguation
+                if (not judge_out.get("should_pause_for_human")) and (judge_out.get("winner_index") is not None) and (not bias_alarm):
+                    wi = int(judge_out["winner_index"])
+                    if 0 <= wi < len(new_candidates):
+                        selected_candidate_update = new_candidates[wi]
+                        awaiting = False
+                else:
+                    awaiting = True
+
+                if awaiting or logger.isEnabledFor(logging.DEBUG):
+                    # Persist ranking + diagnostics for transparency (the user has to decide)
+                    all_notes.append(
+                        "[judge] "
+                        f"ranking={judge_out.get('ranking')} "
+                        f"winner_index={judge_out.get('winner_index')} "
+                        f"conf={judge_out.get('confidence')} "
+                        f"diag={str(diag)[:800]}"
+                    )
+
+                    # Human-readable tool message with diagnostics
+                    router_diag = diag.get("router") or {}
+                    chosen_models = router_diag.get("chosen_models", [])
+                    tool_msgs.append(
+                        _tool_msg(
+                            content=(
+                                "LLM Judge decision:\n"
+                                f"- winner_index: {judge_out.get('winner_index')}\n"
+                                f"- confidence: {judge_out.get('confidence'):.3f}\n"
+                                f"- pause: {judge_out.get('should_pause_for_human')} (bias_alarm={bias_alarm})\n"
+                                f"- ranking (top 5): {str(judge_out.get('ranking', []))[:800]}\n"
+                                f"- router chosen models: {chosen_models}\n"
+                                f"- bias diag: {bias}"
+                            ),
+                            name="llm_judge",
+                            tool_call_id="judge_candidates"
+                        )
+                    )
+                else:
+                    # auto-selected: a one-liner is all the planner needs
+                    line = (
+                        f"[judge] auto-selected [{judge_out['winner_index']}] "
+                        f"{selected_candidate_update.get('name') or '?'} — {selected_candidate_update.get('url') or ''} "
+                        f"(conf={judge_out.get('confidence'):.3f})"
+                    )
+                    all_notes.append(line)
+                    tool_msgs.append(_tool_msg(content="LLM Judge decision: " + line, name="llm_judge", tool_call_id="judge_candidates"))
 
 
 
 
 
 
+            else:
+                # same text as concatenating every result and slicing to 25000, built under that budget
+                txt_parts: List[str] = []
+                budget = 25000
+                for c, r in zip(nonimage_calls, results):
+                    part = f"\n\n--- Results from {c.get('name')} ---\n{r if not isinstance(r, Exception) else f'Exception: {r}'}"[:budget]
+                    txt_parts.append(part)
+                    budget -= len(part)
+                    if budget <= 0:
+                        break
+                combined_txt = "".join(txt_parts)
+
+                prompt = safe_format(
+                    summarize_tool_output_prompt,
+                    research_brief=brief,
+                    tool_name="Parallel Search Batch",
+                    tool_args={c["name"]: c.get("args", {}) for c in nonimage_calls},
+                    tool_output=combined_txt,
+                )
+                summ = await agg.ainvoke([HumanMessage(content=prompt)])
+                note_text = getattr(summ, "content", str(summ))
+                arb_task = _start_arbitration(note_text)
+                all_notes.append(note_text)
+                tool_msgs.append(_tool_msg(content=note_text, name="direct_search", tool_call_id=nonimage_calls[0].get("id", "auto_nonimage_0")))
+                used += len(nonimage_calls)
+
+                extraction_prompt = (
+                    "From the summary below, extract ALL candidate entities (people/companies/profiles) "
+                    "that might match the brief.\nReturn STRICT JSON list of objects with fields: name, url, why.\n"
+                    f"Brief:\n{brief}\n\nSummary:\n{note_text}\n"
+                )
+                extractor = _chat_model(extraction_model, 0.0, None, config)
+                try:
+                    ext = await extractor.ainvoke([HumanMessage(content=extraction_prompt)])
+                    raw = getattr(ext, "content", "[]")
+                    extracted = _json_loads(raw if isinstance(raw, str) else str(raw))
+                    cands_raw: List[Dict[str, Any]] = []
+                    for e in extracted or []:
+                        cands_raw.append({
+                            "name": str(e.get("name","")).strip(),
+                            "url":  str(e.get("url","")).strip(),
+                            "why":  str(e.get("why","")).strip(),
+                        })
+                    new_candidates = _extend_unique([], cand_seen, cands_raw)
+                    awaiting = bool(new_candidates)
+                except Exception as e:
+                    logger.warning("candidate extraction failed: %s", e)
+                    new_candidates = []
+                    awaiting = False
         else:
-            combined_txt = ""
-            for c, r in zip(nonimage_calls, results):
-                combined_txt += f"\n\n--- Results from {c.get('name')} ---\n{r if not isinstance(r, Exception) else f'Exception: {r}'}"
-
-            prompt = safe_format(
-                summarize_tool_output_prompt,
-                research_brief=state.get("research_brief"),
-                tool_name="Parallel Search Batch",
-                tool_args={c["name"]: c.get("args", {}) for c in nonimage_calls},
-                tool_output=combined_txt[:25000],
-            )
-            summ = await agg.ainvoke([HumanMessage(content=prompt)])
-            note_text = getattr(summ, "content", str(summ))
-            all_notes.append(note_text)
-            tool_msgs.append(ToolMessage(content=note_text, name="direct_search", tool_call_id=nonimage_calls[0].get("id", "auto_nonimage_0")))
-            used += len(nonimage_calls)
-
-            extraction_prompt = (
-                "From the summary below, extract ALL candidate entities (people/companies/profiles) "
-                "that might match the brief.\nReturn STRICT JSON list of objects with fields: name, url, why.\n"
-                f"Brief:\n{state.get('research_brief')}\n\nSummary:\n{note_text}\n"
-            )
-            extractor = ChatOpenAI(
-                model=getattr(cfg, "candidate_extraction_model", getattr(cfg, "aggregator_model", Constants.AGGREGATOR_MODEL)),
-                api_key=SecretStr(get_api_key_for_model(getattr(cfg, "candidate_extraction_model", getattr(cfg, "aggregator_model", Constants.AGGREGATOR_MODEL)), config)),
-                base_url=os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"),
-                temperature=0.0,
-            )
-            try:
-                ext = await extractor.ainvoke([HumanMessage(content=extraction_prompt)])
-                raw = getattr(ext, "content", "[]")
-                import json
-                extracted = json.loads(raw if isinstance(raw, str) else str(raw))
-                cands_raw: List[Dict[str, Any]] = []
-                for e in extracted or []:
-                    cands_raw.append({
-                        "name": str(e.get("name","")).strip(),
-                        "url":  str(e.get("url","")).strip(),
-                        "why":  str(e.get("why","")).strip(),
-                    })
-                new_candidates = _dedup(cands_raw)
-                awaiting = bool(new_candidates)
-            except Exception as e:
-                logger.warning("candidate extraction failed: %s", e)
-                new_candidates = []
-                awaiting = False
-    else:
-        new_candidates = []
-        awaiting = False
-
-    # --- Other tools ---
-    if other_calls:
-        tool_map = {t.name: t for t in await get_all_tools(config)}
-        for c in other_calls:
-            t = tool_map.get(c.get("name", ""))
-            if not t:
-                continue
-            obs = await t.ainvoke(c.get("args", {}))
-            s = _shorten(str(obs), limit=20000)
-            all_notes.append(s)
-            tool_msgs.append(ToolMessage(content=s, name=c.get("name", ""), tool_call_id=c.get("id", f"auto_{c.get('name','tool')}_0")))
+            new_candidates = []
+            awaiting = False
+
+        # --- Other tools ---
+        if other_calls:
+            # independent calls: run them together, record results in the planner's order
+            runnable = [c for c in other_calls if c.get("name", "") in tool_map]
+
+            async def run_other(c: Dict[str, Any]) -> Any:
+                async with search_sem:
+                    return await tool_map[c["name"]].ainvoke(c.get("args", {}))
+
+            other_obs = await asyncio.gather(*(run_other(c) for c in runnable), return_exceptions=True)
+            for c, obs in zip(runnable, other_obs):
+                if isinstance(obs, Exception):
+                    obs = {"error": f"❌ Error in {c['name']}: {obs}"}
+                s = _shorten(str(obs), limit=20000)
+                all_notes.append(s)
+                tool_msgs.append(_tool_msg(content=s, name=c.get("name", ""), tool_call_id=c.get("id", f"auto_{c.get('name','tool')}_0")))
+    except BaseException:
+        # arbitration was started early; don't leak it if the searches above fail
+        if arb_task is not None and not arb_task.done():
+            arb_task.cancel()
+            await asyncio.gather(arb_task, return_exceptions=True)
+        raise
 
     # --- Judge (optional) ---
     try:
-        judge_inputs = {}
-        if note_text:
-            judge_inputs["direct_search_summary"] = note_text
-
-        if judge_inputs and getattr(cfg, "use_judge", True):
-            arb = await adjudicate_conflicts(
-                research_brief=state.get("research_brief") or "",
-                agent_findings=judge_inputs,
-                config=config,
-            )
-            tool_msgs.append(ToolMessage(content="Judge arbitration:\n" + str(arb), name="llm_judge", tool_call_id="judge_step"))
+        if arb_task is not None:
+            arb = await arb_task
+            tool_msgs.append(_tool_msg(content="Judge arbitration:\n" + str(arb), name="llm_judge", tool_call_id="judge_step"))
             judge_cands_raw: List[Dict[str, Any]] = []
             for c in arb.get("candidates") or []:
                 judge_cands_raw.append({
@@ -963,24 +1349,15 @@ async def supervisor_tools(state: DeepResearchState, config: RunnableConfig) ->
                     "why":  str(c.get("why","")).strip(),
                 })
             if judge_cands_raw:
-                new_candidates = _dedup((new_candidates or []) + judge_cands_raw)  # type: ignore[arg-type]
+                new_candidates = _extend_unique(new_candidates, cand_seen, judge_cands_raw)
             if arb.get("should_pause_for_human"):
                 awaiting = True
     except Exception as e:
         logger.warning(f"Judge arbitration failed: {e}")
     # --- SAFETY GUARD: no candidates, no URLs => stop early ---
-    def _extract_urls_from_notes(notes: List[str]) -> set[str]:
-        import re
-        url_re = r'https?://[^\s,"\')<>]+'
-        urls = set()
-        for n in notes or []:
-            urls.update(re.findall(url_re, n))
-        return urls
-
-    allowed_urls = _extract_urls_from_notes(all_notes)
     # --- SAFETY: stop early when there's nothing actionable ---
-    if not new_candidates and not allowed_urls:
-        tool_msgs.append(ToolMessage(
+    if not new_candidates and not _notes_have_urls(all_notes):
+        tool_msgs.append(_tool_msg(
             content="No actionable candidates or URLs; stopping.",
             name="early_stop",
             tool_call_id="stop"))
@@ -1065,7 +1442,7 @@ def init_state(query: str, image_url: Optional[str] = None) -> DeepResearchState
     "candidates": [],
     "awaiting_disambiguation": False,
     "selected_candidate": None,
-    "rejected_urls": [],
+    "rejected_urls": frozenset(),
     "image_probe_done": False,  # NEW
 }
 
@@ -1084,7 +1461,7 @@ def resume_after_user_choice(prev_state: DeepResearchState, selection_index: int
         # capture the candidate URLs that were proposed
         rejected = [c.get("url", "") for c in cand_list if c.get("url")]
         # persist them
-        new_state["rejected_urls"] = list(set((prev_state.get("rejected_urls") or []) + rejected))
+        new_state["rejected_urls"] = _union_urls(prev_state.get("rejected_urls"), rejected)
         # clear candidates so we don't immediately pause again
         new_state["candidates"] = []
         # also add a trace message to the conversation
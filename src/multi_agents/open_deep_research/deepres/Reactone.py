@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Annotated, Any, Dict, List, Literal, Optional, cast
 import re
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, SecretStr
+from pydantic import BaseModel, Field
 from typing_extensions import TypedDict
 
 from langchain.agents import AgentExecutor, create_react_agent
@@ -24,6 +24,7 @@ from langchain_core.tools import tool, BaseTool
 from langgraph.graph import END, StateGraph, add_messages
 
 from ..constants.constants import Constants
+from multi_agents.common.llm_clients import get_async_chat_model
 from ..tools import search_tools
 from .configuration import Configuration
 from multi_agents.Prompts.open_deep_research_prompts import (
@@ -67,6 +68,24 @@ ALL_TOOLS: List[BaseTool] = [
     search_tools.youtube_search, search_tools.yelp_search,
 ]
 
+# The tool list is fixed, so the ReAct prompt is built (and its tool text joined)
+# once; only {date} is left open and supplied with each invocation.
+_TOOLS_DESC = "\n".join(f"{t.name}: {t.description}" for t in ALL_TOOLS)
+_TOOL_NAMES = ", ".join(t.name for t in ALL_TOOLS)
+_REACT_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", lead_researcher_prompt),
+    ("user", "{input}"),
+    ("ai", "{agent_scratchpad}"),
+]).partial(tools=_TOOLS_DESC, tool_names=_TOOL_NAMES)
+
+def _openrouter_model(model_name: str, config: Optional[RunnableConfig]) -> ChatOpenAI:
+    # pooled per event loop (see common.llm_clients)
+    return get_async_chat_model(
+        model_name, 0.1,
+        api_key=get_api_key_for_model(model_name, config),
+        base_url=os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"),
+    )
+
 # --- Graph Nodes ---
 
 async def write_research_brief(state: DeepResearchState, config: Optional[RunnableConfig] = None) -> Dict[str, Any]:
@@ -75,7 +94,7 @@ async def write_research_brief(state: DeepResearchState, config: Optional[Runnab
     all_messages_text = get_buffer_string(state["messages"])
     
     configurable = Configuration.from_runnable_config(config)
-    model = ChatOpenAI(model=configurable.planner_model, api_key=SecretStr(get_api_key_for_model(configurable.planner_model, config)), base_url=os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"), temperature=0.1).with_structured_output(ResearchQuestion)
+    model = _openrouter_model(configurable.planner_model, config).with_structured_output(ResearchQuestion)
     prompt_text = transform_messages_into_research_topic_prompt.format(messages=all_messages_text, date=get_today_str())
     
     response_object = await model.ainvoke([HumanMessage(content=prompt_text)])
@@ -88,19 +107,8 @@ async  def research_agent_node(state: DeepResearchState, config: Optional[Runnab
     """This single node is a robust ReAct agent that executes the entire research process."""
     configurable = Configuration.from_runnable_config(config)
     
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", lead_researcher_prompt),
-        ("user", "{input}"),
-        ("ai", "{agent_scratchpad}"),
-    ])
-    prompt = prompt.partial(
-        date=get_today_str(),
-        tools="\n".join([f"{tool.name}: {tool.description}" for tool in ALL_TOOLS]),
-        tool_names=", ".join([tool.name for tool in ALL_TOOLS]),
-    )
-    
-    llm = ChatOpenAI(model=configurable.planner_model, api_key=SecretStr(get_api_key_for_model(configurable.planner_model, config)), base_url=os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"), temperature=0.1)
-    agent = create_react_agent(llm, ALL_TOOLS, prompt)
+    llm = _openrouter_model(configurable.planner_model, config)
+    agent = create_react_agent(llm, ALL_TOOLS, _REACT_PROMPT)
     agent_executor = AgentExecutor(agent=agent, tools=ALL_TOOLS, handle_parsing_errors=True, verbose=True)
 
     research_brief = state.get("research_brief") or ""
@@ -108,7 +116,7 @@ async  def research_agent_node(state: DeepResearchState, config: Optional[Runnab
     # --- START OF ROBUST EXECUTION BLOCK ---
     try:
         # The AgentExecutor will run its own internal ReAct loop here until it's done or fails.
-        response = await agent_executor.ainvoke({"input": research_brief}, config=config)
+        response = await agent_executor.ainvoke({"input": research_brief, "date": get_today_str()}, config=config)
         output = response.get("output", "The research agent finished but produced no final output.")
     except Exception as e:
         # If the AgentExecutor loop crashes for any reason, we catch it here.
@@ -0,0 +1,127 @@
+# src/multi_agents/open_deep_research/llm_cache.py
+import asyncio
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Iterable, Optional, Sequence, Tuple
+
+from langchain_core.messages import BaseMessage
+
+logger = logging.getLogger(__name__)
+
+# In-process LRU of LLM outputs keyed by sha256(model + prompt [+ tools]).
+# Only exact repeats hit (same brief conversation, same planner window, same
+# proposer transcript), so a cached answer is always one the model already
+# gave for that exact input.
+_LLM_CACHE_MAX = 256
+_LLM_CACHE: "OrderedDict[str, Any]" = OrderedDict()
+_llm_cache_lock = threading.Lock()
+
+
+try:
+    import orjson
+
+    def _canonical_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _canonical_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, default=str).encode("utf-8")
+
+
+def prompt_key(model: str, messages: Sequence[BaseMessage], tools: Iterable[str] = ()) -> str:
+    """sha256 over the model name, the full message list (incl. tool calls) and bound tool names."""
+    payload = {"model": model, "msgs": [m.model_dump() for m in messages], "tools": sorted(tools)}
+    return hashlib.sha256(_canonical_bytes(payload)).hexdigest()
+
+
+async def get_or_compute(key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the cached value for key, or await fn() and cache its result."""
+    with _llm_cache_lock:
+        if key in _LLM_CACHE:
+            _LLM_CACHE.move_to_end(key)
+            logger.info("✅ LLM cache HIT %s", key[:12])
+            return _LLM_CACHE[key]
+    val = await fn()
+    with _llm_cache_lock:
+        _LLM_CACHE[key] = val
+        _LLM_CACHE.move_to_end(key)
+        if len(_LLM_CACHE) > _LLM_CACHE_MAX:
+            _LLM_CACHE.popitem(last=False)
+    return val
+
+
+# Semantic layer behind the exact match, for prompts that depend only on user
+# input (write_research_brief): a rephrased request whose embedding is within
+# SEMANTIC_THRESHOLD cosine of an earlier one reuses that answer. Not used for
+# planner turns, where windows differing only in a tool result must not share a plan.
+# sentence-transformers is optional here; without it only exact matches hit.
+SEMANTIC_THRESHOLD = 0.95
+_SEMANTIC_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+_SEM_MAX = 128
+_SEM_CACHE: "OrderedDict[str, Tuple[str, Any, Any]]" = OrderedDict()  # key -> (namespace, embedding, value)
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+
+@lru_cache(maxsize=1)
+def _embedder() -> Any:
+    return SentenceTransformer(_SEMANTIC_MODEL)
+
+
+def _embed(text: str) -> Any:
+    return _embedder().encode(text, normalize_embeddings=True)
+
+
+async def get_or_compute_semantic(
+    key: str,
+    namespace: str,
+    text: str,
+    fn: Callable[[], Awaitable[Any]],
+    threshold: float = SEMANTIC_THRESHOLD,
+) -> Any:
+    """
+    get_or_compute(key, fn), plus a cosine lookup of text against earlier entries
+    in the same namespace (e.g. model + date) before falling back to fn().
+    """
+    with _llm_cache_lock:
+        if key in _LLM_CACHE:
+            _LLM_CACHE.move_to_end(key)
+            logger.info("✅ LLM cache HIT %s", key[:12])
+            return _LLM_CACHE[key]
+    if SentenceTransformer is None:
+        return await get_or_compute(key, fn)
+
+    emb: Optional[Any] = None
+    try:
+        emb = await asyncio.to_thread(_embed, text)  # CPU-bound; keep it off the loop
+    except Exception as e:
+        logger.warning("Semantic cache disabled for this call: %s", e)
+    if emb is not None:
+        best_key, best_sim, best_val = None, threshold, None
+        with _llm_cache_lock:
+            for k, (ns, e_vec, val) in _SEM_CACHE.items():
+                if ns != namespace:
+                    continue
+                sim = float(e_vec @ emb)  # both normalized -> cosine
+                if sim >= best_sim:
+                    best_key, best_sim, best_val = k, sim, val
+            if best_key is not None:
+                _SEM_CACHE.move_to_end(best_key)
+        if best_key is not None:
+            logger.info("✅ LLM semantic cache HIT %s (cos=%.3f)", best_key[:12], best_sim)
+            return best_val
+
+    val = await get_or_compute(key, fn)
+    if emb is not None:
+        with _llm_cache_lock:
+            _SEM_CACHE[key] = (namespace, emb, val)
+            _SEM_CACHE.move_to_end(key)
+            if len(_SEM_CACHE) > _SEM_MAX:
+                _SEM_CACHE.popitem(last=False)
+    return val
@@ -1,12 +1,11 @@
 # src/multi_agents/open_deep_research/state.py
 
 import operator
-from typing import Annotated, Optional, List, Dict
+from typing import Annotated, List
 from typing_extensions import TypedDict
 from pydantic import BaseModel, Field
 
 from langchain_core.messages import MessageLikeRepresentation
-from langgraph.graph import MessagesState
 
 # -------- Structured outputs --------
 class ConductResearch(BaseModel):
@@ -36,36 +35,18 @@ class ResearchQuestion(BaseModel):
 def override_reducer(current_value, new_value):
     if isinstance(new_value, dict) and new_value.get("type") == "override":
         return new_value.get("value", new_value)
+    # LangGraph checkpoints keep references to prior channel values, so the
+    # old list is never extended in place; only skip the copy when one side is empty.
+    if not new_value and current_value is not None:
+        return current_value
+    if not current_value and isinstance(new_value, list):
+        return new_value
     return operator.add(current_value, new_value)
 
 # -------- State definitions --------
-class AgentInputState(MessagesState):
-    """Input state is only 'messages' (via MessagesState)."""
-
-class AgentState(MessagesState):
-    """
-    Deep-research main state. NOTE: Annotations only — no defaults here.
-    Initialize values when creating the state.
-    """
-    # Supervisor planning/control within the subgraph
-    supervisor_messages: Annotated[List[MessageLikeRepresentation], override_reducer]
-    research_brief: Optional[str]
-
-    # Notes
-    raw_notes: Annotated[List[str], override_reducer]
-    notes: Annotated[List[str], override_reducer]
-
-    # Final synthesis
-    final_report: str
-
-    # Optional / extra
-    image_url: Optional[str]
-    serp_calls_used: int
-
-    # Human-in-the-loop (candidate disambiguation inside subgraph)
-    awaiting_user_confirmation: bool
-    candidate_options: Annotated[List[Dict], override_reducer]
-    selected_candidate: Optional[Dict]
+# The graph-level AgentState lives in multi_agents/graph/state.py and the
+# deep-research graph state is DeepResearchState in deep_researcher.py.
+# Only the sub-agent states are kept here.
 
 class SupervisorState(TypedDict, total=False):
     supervisor_messages: Annotated[List[MessageLikeRepresentation], override_reducer]
@@ -81,6 +62,6 @@ class ResearcherState(TypedDict, total=False):
     compressed_research: str
     raw_notes: Annotated[List[str], override_reducer]
 
-class ResearcherOutputState(BaseModel):
+class ResearcherOutputState(TypedDict, total=False):
     compressed_research: str
     raw_notes: List[str]
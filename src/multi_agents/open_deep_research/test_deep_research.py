@@ -1,9 +1,12 @@
 import asyncio
 import os
+import re
 import logging
+from bisect import insort
+from collections import Counter
 from typing import List, Dict
 
-from langchain_core.messages import HumanMessage, ToolMessage
+from langchain_core.messages import HumanMessage
 from multi_agents.open_deep_research.database import setup_database
 from multi_agents.open_deep_research.deep_researcher import (
     deep_researcher,
@@ -24,69 +27,98 @@ logger = logging.getLogger("test_deep_researcher")
 # ----------------------------
 # Evidence utilities
 # ----------------------------
-def process_and_display_evidence(notes: List[str]) -> None:
-    from urllib.parse import urlparse
-    import re
+URL_RE = re.compile(r'https?://[^\s,"\'<>]+')
+# netloc of a URL_RE match: everything up to the first "/", "?" or "#"
+HOST_RE = re.compile(r"https?://([^/?#]*)")
+
+# Keep a *small* junk list (heavy redirects/tracking),
+# but DO NOT nuke common CDNs or image hosts anymore.
+JUNK_SUBSTRINGS = (
+    "google.com/url?", "google.com/search?",
+    "schemas.microsoft.com", "w3.org",
+    "cdn-cgi"  # cloudflare boilerplate
+)
+# one C-level scan per URL instead of a Python `in` per substring
+JUNK_RE = re.compile("|".join(map(re.escape, JUNK_SUBSTRINGS)))
+
+# Whitelist hosts that often appear in image/Lens results
+ALLOW_HOSTS = frozenset({
+    # Wikimedia / Wikipedia
+    "upload.wikimedia.org", "commons.wikimedia.org", "wikipedia.org",
+    # Flickr
+    "flickr.com", "live.staticflickr.com",
+    # Adobe Stock / FTCDN
+    "stock.adobe.com", "t3.ftcdn.net", "ftcdn.net",
+    # Shutterstock / iStock / Getty / Alamy / Depositphotos
+    "shutterstock.com", "image.shutterstock.com",
+    "istockphoto.com", "media.istockphoto.com",
+    "gettyimages.com", "media.gettyimages.com",
+    "alamy.com", "l450v.alamy.com",
+    "depositphotos.com", "st.depositphotos.com",
+    # Squarespace / common image CDNs
+    "images.squarespace-cdn.com", "squarespace-cdn.com",
+    "cdn.getyourguide.com", "i.pinimg.com",
+    # Instagram lookaside + Threads images
+    "lookaside.instagram.com", "lookaside.fbsbx.com",
+    "threads.com", "www.threads.com",
+    # Generic image/file CDNs
+    "i.imgur.com", "imgur.com", "staticflickr.com"
+})
+
+SOCIAL_DOMAINS = (
+    "linkedin.com", "facebook.com", "instagram.com", "threads.net", "threads.com",
+    "twitter.com", "x.com", "youtube.com", "tiktok.com"
+)
+SOCIAL_RE = re.compile("|".join(map(re.escape, SOCIAL_DOMAINS)))
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp", ".tiff")
+NEWS_RE = re.compile(r"news|article|/posts/|/blog/")
+CORP_RE = re.compile(r"company|business|/about")
+IMG_BLOCK_NEEDLE = "Image search produced candidates"
+LANDMARK_RE = re.compile("Trafalgar Square|Visit London|Wikipedia")
+JUDGE_NOTE_RE = re.compile(r"^\[judge\]|LLM Judge decision")
+
+
+def category_for(u: str, h: str) -> str:
+    """Evidence-locker bucket for a lowercased URL and its host (first match wins)."""
+    if SOCIAL_RE.search(h):
+        return "Social Media & Profiles"
+    if u.endswith(IMAGE_EXTS) or h in ALLOW_HOSTS:
+        return "Image & Visual Content"
+    if NEWS_RE.search(u):
+        return "News & Articles"
+    if CORP_RE.search(u):
+        return "Corporate & Business"
+    return "Other Relevant Links"
+
 
+def process_and_display_evidence(notes: List[str]) -> None:
     print("\n\n--- EVIDENCE LOCKER (Sources Found) ---")
     if not notes:
         print("No research notes were produced to extract evidence from.")
         return
 
-    url_pattern = r'https?://[^\s,"\'<>]+'
-    full_text = "\n".join(notes)
-    urls_found = re.findall(url_pattern, full_text)
+    # 1) Collect + de-dupe note by note (no joined copy of all notes)
+    urls_found = set()
+    for n in notes:
+        urls_found.update(URL_RE.findall(n))
     if not urls_found:
         print("No URLs were found in the agent's research notes.")
         return
 
-    # 1) De-dupe
-    unique_urls = sorted(set(urls_found))
-
-    # 2) Keep a *small* junk list (heavy redirects/tracking),
-    #    but DO NOT nuke common CDNs or image hosts anymore.
-    junk_substrings = [
-        "google.com/url?", "google.com/search?",
-        "schemas.microsoft.com", "w3.org",
-        "cdn-cgi"  # cloudflare boilerplate
-    ]
-
-    # 3) Whitelist hosts that often appear in image/Lens results
-    ALLOW_HOSTS = {
-        # Wikimedia / Wikipedia
-        "upload.wikimedia.org", "commons.wikimedia.org", "wikipedia.org",
-        # Flickr
-        "flickr.com", "live.staticflickr.com",
-        # Adobe Stock / FTCDN
-        "stock.adobe.com", "t3.ftcdn.net", "ftcdn.net",
-        # Shutterstock / iStock / Getty / Alamy / Depositphotos
-        "shutterstock.com", "image.shutterstock.com",
-        "istockphoto.com", "media.istockphoto.com",
-        "gettyimages.com", "media.gettyimages.com",
-        "alamy.com", "l450v.alamy.com",
-        "depositphotos.com", "st.depositphotos.com",
-        # Squarespace / common image CDNs
-        "images.squarespace-cdn.com", "squarespace-cdn.com",
-        "cdn.getyourguide.com", "i.pinimg.com",
-        # Instagram lookaside + Threads images
-        "lookaside.instagram.com", "lookaside.fbsbx.com",
-        "threads.com", "www.threads.com",
-        # Generic image/file CDNs
-        "i.imgur.com", "imgur.com", "staticflickr.com"
-    }
+    def host(u: str) -> str:
+        m = HOST_RE.match(u)
+        return m.group(1).lower() if m else ""
 
-    def is_junk(u: str) -> bool:
-        low = u.lower()
-        if any(s in low for s in junk_substrings):
-            host = urlparse(u).netloc.lower()
-            if host in ALLOW_HOSTS:
-                return False
-            return True
-        return False
+    # parse + lowercase each URL once; both feed the junk filter and categorization
+    parsed = ((u, u.lower(), host(u)) for u in urls_found)
 
-    cleaned = [u for u in unique_urls if not is_junk(u)]
+    # 2) Drop tracking/boilerplate links (JUNK_RE), unless the host is whitelisted
+    cleaned = ((u, lu, h) for u, lu, h in parsed if h in ALLOW_HOSTS or not JUNK_RE.search(lu))
 
-    # 4) Simple categorization
+    # 3) Simple categorization, streamed: full counts, but only the MAX_SHOW smallest
+    #    URLs per category are kept (sorted), so no global sort of every URL
+    MAX_SHOW = 25
+    counts: Counter = Counter()
     categories: Dict[str, List[str]] = {
         "Social Media & Profiles": [],
         "News & Articles": [],
@@ -94,43 +126,28 @@ def process_and_display_evidence(notes: List[str]) -> None:
         "Image & Visual Content": [],
         "Other Relevant Links": [],
     }
-    social_domains = [
-        "linkedin.com", "facebook.com", "instagram.com", "threads.net", "threads.com",
-        "twitter.com", "x.com", "youtube.com", "tiktok.com"
-    ]
-    image_exts = (".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp", ".tiff")
 
-    def host(u: str) -> str:
-        try:
-            return urlparse(u).netloc.lower()
-        except Exception:
-            return ""
-
-    for url in cleaned:
-        u = url.lower()
-        h = host(url)
-        if any(d in h for d in social_domains):
-            categories["Social Media & Profiles"].append(url)
-        elif u.endswith(image_exts) or h in ALLOW_HOSTS:
-            categories["Image & Visual Content"].append(url)
-        elif "news" in u or "article" in u or "/posts/" in u or "/blog/" in u:
-            categories["News & Articles"].append(url)
-        elif "company" in u or "business" in u or "/about" in u:
-            categories["Corporate & Business"].append(url)
-        else:
-            categories["Other Relevant Links"].append(url)
-
-    # 5) Print with counts (cap each section to keep it tidy)
+    for url, lu, h in cleaned:
+        cat = category_for(lu, h)
+        counts[cat] += 1
+        shown = categories[cat]
+        if len(shown) < MAX_SHOW:
+            insort(shown, url)
+        elif url < shown[-1]:
+            shown.pop()
+            insort(shown, url)
+
+    # 4) Print with counts (cap each section to keep it tidy)
     found_any = False
-    MAX_SHOW = 25
     for cat, urls in categories.items():
-        if urls:
+        n = counts[cat]
+        if n:
             found_any = True
-            print(f"\n[{cat}] ({len(urls)})")
-            for u in urls[:MAX_SHOW]:
+            print(f"\n[{cat}] ({n})")
+            for u in urls:
                 print(f"  - {u}")
-            if len(urls) > MAX_SHOW:
-                print(f"  ... (+{len(urls) - MAX_SHOW} more)")
+            if n > MAX_SHOW:
+                print(f"  ... (+{n - MAX_SHOW} more)")
 
     if not found_any:
         print("No meaningful URLs were found after filtering.")
@@ -141,16 +158,12 @@ def summarize_image_search_for_manager(notes: List[str]) -> None:
     if not notes:
         print("No image-search notes were produced.")
         return
-    block = None
-    for n in notes:
-        if "Image search produced candidates" in n:
-            block = n
-            break
+    block = next((n for n in notes if IMG_BLOCK_NEEDLE in n), None)
     if not block:
         print("We ran a reverse-image pass, but it did not return useful profile matches. We continued with name-based search.")
         return
 
-    if any(sig in block for sig in ["Trafalgar Square", "Visit London", "Wikipedia"]):
+    if LANDMARK_RE.search(block):
         print("The reverse-image search returned landmarks instead of profile matches. We continued with name/business search.")
     else:
         print("Reverse-image search returned some visual matches, but we relied more on name/business search for precision.")
@@ -174,7 +187,7 @@ def show_judge_xai(state: DeepResearchState) -> None:
     planner_msgs = state.get("planner_messages", []) or []
     found_llm_judge = False
     for m in planner_msgs:
-        if isinstance(m, ToolMessage) and getattr(m, "name", "") == "llm_judge":
+        if getattr(m, "type", None) == "tool" and getattr(m, "name", "") == "llm_judge":
             found_llm_judge = True
             print("\n[llm_judge ToolMessage]")
             print(m.content)
@@ -183,7 +196,7 @@ def show_judge_xai(state: DeepResearchState) -> None:
         print("No llm_judge ToolMessage found in planner_messages (routing/diagnostics might be disabled or judge errored).")
 
     notes = state.get("notes", []) or []
-    judge_notes = [n for n in notes if n.startswith("[judge]") or "LLM Judge decision" in n]
+    judge_notes = [n for n in notes if JUDGE_NOTE_RE.search(n)]
     if judge_notes:
         print("\n--- JUDGE NOTES (from `notes`) ---")
         for jn in judge_notes:
@@ -233,7 +246,7 @@ async def main() -> None:
         "candidates": [],
         "awaiting_disambiguation": False,
         "selected_candidate": None,
-        "rejected_urls": [],
+        "rejected_urls": frozenset(),
         "image_probe_done": False,
     }
 
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import inspect
+import logging
 from typing import Any, Dict, Optional, Tuple
 
 from .graph.builder import GraphBuilder
 
+logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=1)
 def build_app() -> Tuple[Any, Any]:
     """
     Build the multi-agent graph and return (app, supervisor_instance).
 
     The supervisor instance is returned so notebooks can call its
     ingest_user_selection(...) helper between runs when HITL pauses occur.
+
+    Built once per process: the supervisor and workers keep no per-run state
+    (everything lives in AgentState), so repeated runs reuse the compiled graph.
     """
     builder = GraphBuilder()
     app = builder.build_graph()
@@ -82,7 +91,7 @@ def resume_after_human(
     return state
 
 
-def run_interactive(
+async def run_interactive_async(
     query: str,
     *,
     selection_provider: Optional[callable] = None,
@@ -90,14 +99,9 @@ def run_interactive(
     config: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
-    Convenient synchronous runner for notebooks:
-      - Builds the app
-      - Runs until a pause or completion
-      - If paused, renders candidates (if any) and asks selection_provider for an index
-      - Resumes and repeats until final report or max_global_steps
-
-    selection_provider is a callable that takes (state) and returns either
-    an int index (for candidate selection) or None (to just continue on judge-only pauses).
+    Async variant of run_interactive for callers already inside an event loop
+    (e.g. `await run_interactive_async(...)` in a notebook cell). Same behavior,
+    without patching the running loop.
     """
     from .graph.state import AgentState  # late import to avoid circulars
 
@@ -118,53 +122,92 @@ def run_interactive(
         "selected_candidate": None,
     }
 
-    async def _drive() -> Dict[str, Any]:
-        state: Dict[str, Any] = initial_state
-        for _ in range(max_global_steps):
-            state = await run_until_pause_or_done(app, state, max_iters=5, config=config)
+    state: Dict[str, Any] = initial_state
+    for _ in range(max_global_steps):
+        state = await run_until_pause_or_done(app, state, max_iters=5, config=config)
+
+        # Completed
+        if state.get("final_report"):
+            return state
+
+        # No plan → stop gracefully
+        if not state.get("plan") and not state.get("awaiting_user_confirmation"):
+            return state
+
+        # Pause for human
+        if state.get("awaiting_user_confirmation"):
+            cands = state.get("candidate_options") or []
+
+            # Obtain a selection from the provider if available
+            choice = None
+            if selection_provider is not None:
+                try:
+                    # never block the loop on a human: sync providers (input()) run in a thread
+                    if inspect.iscoroutinefunction(selection_provider):
+                        choice = await selection_provider(state)
+                    else:
+                        choice = await asyncio.to_thread(selection_provider, state)
+                except Exception:
+                    choice = None
+
+            # Apply the human input (or just continue on judge-only pauses)
+            state = resume_after_human(
+                supervisor,
+                state,
+                selection_index=choice if isinstance(choice, int) else None,
+            )
+
+            # Loop continues to drive more steps
 
-            # Completed
-            if state.get("final_report"):
-                return state
+    return state
 
-            # No plan → stop gracefully
-            if not state.get("plan") and not state.get("awaiting_user_confirmation"):
-                return state
 
-            # Pause for human
-            if state.get("awaiting_user_confirmation"):
-                cands = state.get("candidate_options") or []
+_warned_nest_asyncio = False
 
-                # Obtain a selection from the provider if available
-                choice = None
-                if selection_provider is not None:
-                    try:
-                        choice = selection_provider(state)
-                    except Exception:
-                        choice = None
 
-                # Apply the human input (or just continue on judge-only pauses)
-                state = resume_after_human(
-                    supervisor,
-                    state,
-                    selection_index=choice if isinstance(choice, int) else None,
-                )
+def run_interactive(
+    query: str,
+    *,
+    selection_provider: Optional[callable] = None,
+    max_global_steps: int = 30,
+    config: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Convenient synchronous runner for notebooks:
+      - Builds the app
+      - Runs until a pause or completion
+      - If paused, renders candidates (if any) and asks selection_provider for an index
+      - Resumes and repeats until final report or max_global_steps
 
-                # Loop continues to drive more steps
+    selection_provider is a callable (sync or async) that takes (state) and returns either
+    an int index (for candidate selection) or None (to just continue on judge-only pauses).
 
-        return state
+    Inside a running event loop prefer `await run_interactive_async(...)`; this
+    wrapper then has to fall back to nest_asyncio, which slows every await.
+    """
+    global _warned_nest_asyncio
+    coro = run_interactive_async(
+        query,
+        selection_provider=selection_provider,
+        max_global_steps=max_global_steps,
+        config=config,
+    )
 
     # Notebook/event-loop safe: avoid asyncio.run inside running loop
     try:
         loop = asyncio.get_running_loop()
     except RuntimeError:
-        return asyncio.run(_drive())
-
+        return asyncio.run(coro)
+
+    if not _warned_nest_asyncio:
+        _warned_nest_asyncio = True
+        logger.warning(
+            "run_interactive() called inside a running event loop; patching it with "
+            "nest_asyncio. Use `await run_interactive_async(...)` instead."
+        )
     try:
         import nest_asyncio  # type: ignore
         nest_asyncio.apply()
     except Exception:
         pass
-    return loop.run_until_complete(_drive())
-
-
+    return loop.run_until_complete(coro)
@@ -1,12 +1,20 @@
 # airbnb_tools.py
 
-from bs4 import BeautifulSoup
+import atexit
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, List, Dict, Optional, Tuple, Union, Any
+
+from bs4 import BeautifulSoup, SoupStrainer
 from langchain_core.tools import tool
-from typing import List, Dict, Union, Any
 
+from multi_agents.constants.constants import Constants
 from multi_agents.utils.airbnb_utils import (
     initialize_driver,
     get_profile_page_html,
+    try_fetch_profile_html_static,
     get_listing_page_html,
     scrape_profile_details,
     scrape_places_visited,
@@ -38,35 +46,190 @@ def _ensure_not_none(data: Any, msg: str) -> Union[Any, ErrorDict]:
     return data
 
 
+# ---------- Shared Selenium drivers ----------
+class _DriverPool:
+    """
+    Keeps up to max_size idle Chrome drivers for reuse instead of launching
+    (and quitting) a browser per tool call. Thread-safe: tools run in executors.
+    At most max_size drivers are leased at once; further lease() calls wait, so
+    parallel tool calls (ainvoke runs sync tools in worker threads) can't spawn
+    one Chrome each. A driver is relaunched after max_pages leases, since
+    long-lived chromedriver sessions keep growing in memory.
+    """
+
+    def __init__(self, max_size: int = 2, max_pages: int = 50):
+        self.max_size = max(1, max_size)
+        self.max_pages = max_pages
+        self._idle: List[Any] = []
+        self._uses: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+
+    def acquire(self) -> Optional[Any]:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                driver = self._idle.pop()
+            if self._alive(driver):
+                return driver
+            self.discard(driver)
+        return initialize_driver()
+
+    @staticmethod
+    def _alive(driver: Any) -> bool:
+        # an idle Chrome can crash or time out; probe the session before handing it out
+        try:
+            return bool(driver.session_id) and driver.current_url is not None
+        except Exception:
+            return False
+
+    def release(self, driver: Any) -> None:
+        with self._lock:
+            uses = self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        if self.max_pages > 0 and uses >= self.max_pages:
+            self.discard(driver)
+            return
+        # drop per-site state so one profile's session/cookies don't leak into the next load
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception:
+            self.discard(driver)
+            return
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(driver)
+                return
+        self.discard(driver)
+
+    @contextmanager
+    def lease(self) -> Iterator[Optional[Any]]:
+        """Yield a pooled driver (None if Chrome failed to start); a driver that raised is quit, not reused."""
+        with self._slots:
+            driver = self.acquire()
+            if driver is None:
+                yield None
+                return
+            try:
+                yield driver
+            except BaseException:
+                self.discard(driver)
+                raise
+            self.release(driver)
+
+    def discard(self, driver: Any) -> None:
+        # the session may be wedged after an error; don't hand it out again
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close_all(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for d in idle:
+            self.discard(d)
+
+
+_DRIVER_POOL = _DriverPool(Constants.AIRBNB_DRIVER_POOL, Constants.AIRBNB_DRIVER_MAX_PAGES)
+atexit.register(_DRIVER_POOL.close_all)
+
+
+# ---------- Profile page cache ----------
+# The four profile tools all scrape the same page (and the fetch scrolls the whole
+# reviews modal), so one load serves every tool for a few minutes.
+_PROFILE_TTL_SECONDS = 300
+_PROFILE_CACHE_MAX = 64
+_PROFILE_CACHE: "OrderedDict[str, Tuple[float, BeautifulSoup]]" = OrderedDict()
+# Every profile scraper reads <body> (headings, section scrollers, the reviews modal),
+# so the <head> (inline CSS, preload/script tags) is never built into the tree.
+# Per-section strainers would break the heading -> aria-labelledby / sibling lookups.
+_PROFILE_STRAINER = SoupStrainer("body")
+_profile_cache_lock = threading.Lock()
+# one lock per URL being fetched, so profile tools running concurrently on the
+# same profile wait for a single page load instead of each starting their own
+_profile_fetch_locks: Dict[str, threading.Lock] = {}
+
+
+def _cached_profile_soup(profile_url: str) -> Optional[BeautifulSoup]:
+    with _profile_cache_lock:
+        hit = _PROFILE_CACHE.get(profile_url)
+        if hit and time.monotonic() - hit[0] < _PROFILE_TTL_SECONDS:
+            _PROFILE_CACHE.move_to_end(profile_url)
+            return hit[1]
+    return None
+
+
+def _fetch_profile_soup(profile_url: str) -> Union[BeautifulSoup, ErrorDict]:
+    """Parsed profile page for profile_url (cached for _PROFILE_TTL_SECONDS), or {'error': ...}."""
+    soup = _cached_profile_soup(profile_url)
+    if soup is not None:
+        return soup
+
+    with _profile_cache_lock:
+        fetch_lock = _profile_fetch_locks.setdefault(profile_url, threading.Lock())
+    try:
+        with fetch_lock:
+            # another caller may have loaded the page while we waited
+            soup = _cached_profile_soup(profile_url)
+            if soup is not None:
+                return soup
+            return _load_profile_soup(profile_url)
+    finally:
+        with _profile_cache_lock:
+            if _profile_fetch_locks.get(profile_url) is fetch_lock and not fetch_lock.locked():
+                del _profile_fetch_locks[profile_url]
+
+
+def _load_profile_soup(profile_url: str) -> Union[BeautifulSoup, ErrorDict]:
+    html = try_fetch_profile_html_static(profile_url)
+    if html is None:
+        with _DRIVER_POOL.lease() as driver:
+            if not driver:
+                return {"error": "Failed to initialize Selenium WebDriver."}
+            html = get_profile_page_html(driver, profile_url)
+    if not html:
+        return {
+            "error": (
+                f"Failed to get HTML content for {profile_url}. "
+                "The page may be inaccessible, behind a CAPTCHA, or the structure changed."
+            )
+        }
+
+    soup = BeautifulSoup(html, "lxml", parse_only=_PROFILE_STRAINER)
+    with _profile_cache_lock:
+        _PROFILE_CACHE[profile_url] = (time.monotonic(), soup)
+        _PROFILE_CACHE.move_to_end(profile_url)
+        if len(_PROFILE_CACHE) > _PROFILE_CACHE_MAX:
+            _PROFILE_CACHE.popitem(last=False)
+    return soup
+
+
+def _as_list(data: Any, msg: str) -> Union[List[Any], ErrorDict]:
+    parsed = _ensure_not_none(data, msg)
+    if isinstance(parsed, dict) and "error" in parsed:
+        return parsed
+    return list(parsed)
+
+
 @tool
 def get_airbnb_profile_details(profile_url: str) -> Union[ProfileDetails, ErrorDict]:
     """
     Extract profile information from an Airbnb host's profile page.
+    Deprecated when more than one section is needed: call get_airbnb_profile_bundle instead.
     Returns ProfileDetails or {'error': <message>}.
     """
-    driver = None
     try:
-        driver = initialize_driver()
-        if not driver:
-            return {"error": "Failed to initialize Selenium WebDriver."}
-
-        html = get_profile_page_html(driver, profile_url)
-        if not html:
-            return {
-                "error": (
-                    f"Failed to get HTML content for {profile_url}. "
-                    "The page may be inaccessible, behind a CAPTCHA, or the structure changed."
-                )
-            }
-
-        soup = BeautifulSoup(html, "html.parser")
+        soup = _fetch_profile_soup(profile_url)
+        if isinstance(soup, dict):
+            return soup
         details = scrape_profile_details(soup)
         return _ensure_not_none(details, "Could not parse profile details from the page.")
     except Exception as e:
         return {"error": f"Unexpected error in get_airbnb_profile_details: {e}"}
-    finally:
-        if driver:
-            driver.quit()
 
 
 @tool
@@ -75,29 +238,16 @@ def get_airbnb_profile_places_visited(
 ) -> Union[List[PlaceVisited], ErrorDict]:
     """
     Extract the 'Where [host] has been' section.
+    Deprecated when more than one section is needed: call get_airbnb_profile_bundle instead.
     Returns List[PlaceVisited] (possibly empty) or {'error': <message>}.
     """
-    driver = None
     try:
-        driver = initialize_driver()
-        if not driver:
-            return {"error": "Failed to initialize Selenium WebDriver."}
-
-        html = get_profile_page_html(driver, profile_url)
-        if not html:
-            return {"error": f"Failed to get HTML content for {profile_url}."}
-
-        soup = BeautifulSoup(html, "html.parser")
-        places = scrape_places_visited(soup)
-        parsed = _ensure_not_none(places, "No 'places visited' section found or it could not be parsed.")
-        if isinstance(parsed, dict) and "error" in parsed:
-            return parsed
-        return list(parsed)  # type: ignore[arg-type]
+        soup = _fetch_profile_soup(profile_url)
+        if isinstance(soup, dict):
+            return soup
+        return _as_list(scrape_places_visited(soup), "No 'places visited' section found or it could not be parsed.")
     except Exception as e:
         return {"error": f"Unexpected error in get_airbnb_profile_places_visited: {e}"}
-    finally:
-        if driver:
-            driver.quit()
 
 
 @tool
@@ -106,29 +256,16 @@ def get_airbnb_profile_listings(
 ) -> Union[List[Listing], ErrorDict]:
     """
     Extract all property listings hosted by the profile owner.
+    Deprecated when more than one section is needed: call get_airbnb_profile_bundle instead.
     Returns List[Listing] (possibly empty) or {'error': <message>}.
     """
-    driver = None
     try:
-        driver = initialize_driver()
-        if not driver:
-            return {"error": "Failed to initialize Selenium WebDriver."}
-
-        html = get_profile_page_html(driver, profile_url)
-        if not html:
-            return {"error": f"Failed to get HTML content for {profile_url}."}
-
-        soup = BeautifulSoup(html, "html.parser")
-        listings = scrape_listings(soup, profile_url)
-        parsed = _ensure_not_none(listings, "No listings found or listings section could not be parsed.")
-        if isinstance(parsed, dict) and "error" in parsed:
-            return parsed
-        return list(parsed)  # type: ignore[arg-type]
+        soup = _fetch_profile_soup(profile_url)
+        if isinstance(soup, dict):
+            return soup
+        return _as_list(scrape_listings(soup, profile_url), "No listings found or listings section could not be parsed.")
     except Exception as e:
         return {"error": f"Unexpected error in get_airbnb_profile_listings: {e}"}
-    finally:
-        if driver:
-            driver.quit()
 
 
 @tool
@@ -137,29 +274,16 @@ def get_airbnb_profile_reviews(
 ) -> Union[List[Review], ErrorDict]:
     """
     Extract guest reviews and host responses.
+    Deprecated when more than one section is needed: call get_airbnb_profile_bundle instead.
     Returns List[Review] (possibly empty) or {'error': <message>}.
     """
-    driver = None
     try:
-        driver = initialize_driver()
-        if not driver:
-            return {"error": "Failed to initialize Selenium WebDriver."}
-
-        html = get_profile_page_html(driver, profile_url)
-        if not html:
-            return {"error": f"Failed to get HTML content for {profile_url}."}
-
-        soup = BeautifulSoup(html, "html.parser")
-        reviews = scrape_reviews(soup)
-        parsed = _ensure_not_none(reviews, "No reviews found or reviews could not be parsed.")
-        if isinstance(parsed, dict) and "error" in parsed:
-            return parsed
-        return list(parsed)  # type: ignore[arg-type]
+        soup = _fetch_profile_soup(profile_url)
+        if isinstance(soup, dict):
+            return soup
+        return _as_list(scrape_reviews(soup), "No reviews found or reviews could not be parsed.")
     except Exception as e:
         return {"error": f"Unexpected error in get_airbnb_profile_reviews: {e}"}
-    finally:
-        if driver:
-            driver.quit()
 
 
 @tool
@@ -168,21 +292,39 @@ def get_listing_details(listing_url: str) -> Union[ListingDetails, ErrorDict]:
     Extract comprehensive details for a specific listing.
     Returns ListingDetails or {'error': <message>}.
     """
-    driver = None
     try:
-        driver = initialize_driver()
-        if not driver:
-            return {"error": "Failed to initialize Selenium WebDriver."}
-
-        html = get_listing_page_html(driver, listing_url)
+        with _DRIVER_POOL.lease() as driver:
+            if not driver:
+                return {"error": "Failed to initialize Selenium WebDriver."}
+            html = get_listing_page_html(driver, listing_url)
         if not html:
             return {"error": f"Failed to get HTML content for listing {listing_url}."}
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         details = scrape_listing_details(soup)
         return _ensure_not_none(details, "Could not parse listing details from the page.")
     except Exception as e:
         return {"error": f"Unexpected error in get_listing_details: {e}"}
-    finally:
-        if driver:
-            driver.quit()
+
+
+@tool
+def get_airbnb_profile_bundle(profile_url: str) -> Dict[str, Any]:
+    """
+    Everything from an Airbnb profile page in one call: details, places visited,
+    listings and reviews. Loads the page once; prefer this over calling the four
+    profile tools separately.
+    Returns {'details', 'places_visited', 'listings', 'reviews'} (each may be an
+    {'error': <message>}) or {'error': <message>} if the page could not be loaded.
+    """
+    try:
+        soup = _fetch_profile_soup(profile_url)
+        if isinstance(soup, dict):
+            return soup
+        return {
+            "details": _ensure_not_none(scrape_profile_details(soup), "Could not parse profile details from the page."),
+            "places_visited": _as_list(scrape_places_visited(soup), "No 'places visited' section found or it could not be parsed."),
+            "listings": _as_list(scrape_listings(soup, profile_url), "No listings found or listings section could not be parsed."),
+            "reviews": _as_list(scrape_reviews(soup), "No reviews found or reviews could not be parsed."),
+        }
+    except Exception as e:
+        return {"error": f"Unexpected error in get_airbnb_profile_bundle: {e}"}
@@ -19,7 +19,6 @@ import os, sys, json, re, subprocess
 from pathlib import Path
 from urllib.parse import urlparse 
 import requests
-from serpapi import GoogleSearch, BaiduSearch  # SerpApi clients
 import duckdb
 from langchain_core.tools import tool
 from apify_client import ApifyClient
@@ -44,6 +43,7 @@ import subprocess
 
 # Project constants
 from ..constants.constants import Constants, USER_AGENTS, SELENIUM_HOST
+from ..common.llm_clients import get_http_client
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -61,6 +61,25 @@ load_dotenv()
 # =========================
 # SerpApi helper class
 # =========================
+# serpapi.GoogleSearch/BaiduSearch open a fresh requests connection (and TLS
+# handshake) per call; every engine is the same GET endpoint, so go through the
+# process-wide pooled httpx client instead and keep connections alive across
+# the executor threads the @tool functions run on.
+SERPAPI_ENDPOINT = "https://serpapi.com/search"
+
+
+def _serpapi_get(params: Dict[str, Any]) -> Dict[str, Any]:
+    """GET SerpApi JSON for params (engine, q/url/..., api_key). Error payloads come back as {"error": ...}."""
+    resp = get_http_client().get(SERPAPI_ENDPOINT, params={**params, "output": "json", "source": "python"})
+    data = resp.json()
+    if not isinstance(data, dict):
+        resp.raise_for_status()
+        return {"error": f"Unexpected SerpApi payload: {type(data).__name__}"}
+    if resp.is_error and "error" not in data:
+        data["error"] = f"HTTP {resp.status_code}"
+    return data
+
+
 class SearchTools:
     """
     A class that holds the implementation for search tools (SerpApi).
@@ -79,13 +98,7 @@ class SearchTools:
             if USER_AGENTS:
                 params['user_agent'] = random.choice(USER_AGENTS)
 
-            # Baidu has a specific client, all others use the general GoogleSearch client
-            if params.get('engine') == 'baidu':
-                search = BaiduSearch(params)
-            else:
-                search = GoogleSearch(params)
-
-            results = search.get_dict()
+            results = _serpapi_get(params)
 
             if isinstance(results, dict) and "error" in results:
                 logger.error(f"SerpApi Error for engine {params.get('engine')}: {results['error']}")
@@ -524,7 +537,7 @@ def google_lens_search(image_url: str) -> Dict[str, Any]:
     }
 
     try:
-        data = GoogleSearch(params).get_dict()
+        data = _serpapi_get(params)
     except Exception as e:
         logger.exception("SerpApi request failed")
         return {"engine": "google_lens", "error": f"request_failed: {e}"}
@@ -577,7 +590,7 @@ def google_reverse_image_search(image_url: str) -> Dict[str, Any]:
     }
 
     try:
-        data: Dict[str, Any] = GoogleSearch(params).get_dict()
+        data: Dict[str, Any] = _serpapi_get(params)
     except Exception as e:
         logger.exception("SerpApi request failed")
         return {"engine": "google_reverse_image", "error": f"request_failed: {e}"}
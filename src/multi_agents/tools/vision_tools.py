@@ -1,27 +1,20 @@
 # src/multi_agents/tools/vision_tools.py
 from langchain_core.tools import tool
 from typing import Dict, Any, List, Union
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from ..constants.constants import Constants
+from ..common.llm_clients import get_chat_model
 import logging
 import requests
 from io import BytesIO
 from PIL import Image
 import base64
 import json
-from pydantic import SecretStr
 
 class VisionTools:
     def __init__(self):
-        self.llm = ChatOpenAI(
-            base_url=Constants.OPENROUTER_BASE_URL,
-            api_key=SecretStr(Constants.OPENROUTER_API_KEY or ""),
-            # --- This now correctly points to the verified model in constants.py ---
-            model=Constants.VISION_MODEL,
-            temperature=0.1,
-            max_completion_tokens = 4096
-        )
+        # --- This now correctly points to the verified model in constants.py ---
+        self.llm = get_chat_model(Constants.VISION_MODEL, 0.1, max_completion_tokens=4096)
         self.logger = logging.getLogger(__name__)
     
     def compare_profile_pictures(self, image_sources: Union[Dict[str, str], List[str]]) -> Dict[str, Any]:
@@ -13,6 +13,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
+import lxml.html
+
+from multi_agents.common.llm_clients import get_http_client
 from multi_agents.constants.constants import USER_AGENTS
 
 # ---------------------------- Driver setup ----------------------------
@@ -100,6 +103,45 @@ def get_profile_page_html(driver, url):
         return None
 
 
+# Same "Show all reviews" button the Selenium path clicks; if the static page has
+# one, the full review list only exists behind the modal and Selenium is required.
+_SHOW_REVIEWS_XPATH = (
+    "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'show') "
+    "and contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'reviews')]"
+)
+_PROFILE_SENTINEL_XPATH = "//div[contains(concat(' ', normalize-space(@class), ' '), ' h1oqg76h ')]//h2"
+
+
+def try_fetch_profile_html_static(url):
+    """
+    Fast path for get_profile_page_html: plain HTTPS GET on the shared keep-alive
+    client, no browser. Returns the HTML only when the server-rendered page already
+    holds everything the scrapers read (host name block present, no 'Show all
+    reviews' modal to open); otherwise None so the caller falls back to Selenium.
+    """
+    try:
+        resp = get_http_client().get(
+            url,
+            headers={
+                "User-Agent": random.choice(USER_AGENTS),
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.9",
+            },
+            follow_redirects=True,
+            timeout=15.0,
+        )
+        if resp.status_code != 200 or not resp.text:
+            return None
+        html = resp.text
+        tree = lxml.html.fromstring(html)
+        if not tree.xpath(_PROFILE_SENTINEL_XPATH) or tree.xpath(_SHOW_REVIEWS_XPATH):
+            return None
+        return html
+    except Exception as e:
+        print(f"[try_fetch_profile_html_static] falling back to Selenium: {e}")
+        return None
+
+
 def get_listing_page_html(driver, url):
     """
     Navigates to an Airbnb listing URL, performs necessary interactions to reveal all data,